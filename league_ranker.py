@@ -12,25 +12,93 @@ Default output file location or filename is used from the configuration file
 (config.json) if not provided by the user.
 """
 
+import os
 import sys
 
-from modules.cmd_utils import parseArguments, handleError, Modes, printDivider
+from modules.cmd_utils import parseArguments, handleError, Modes, printDivider, config
 from modules.ranker import Ranker
+from modules.approximate_ranker import ApproximateRanker
+from modules.file_reader import readInputFile
+from modules.compiled_format import isCompiledFile, loadCompiledFile, compileResultsFile
+from modules.ranking_cache import RankingCache
+from modules.validator import checkInputFile
+from modules.file_tally import tallyInputFiles
 
 
 def processInputFile(filename: str, ranker: Ranker) -> None:
     """Game results are read line-by-line from a file and processed by an 
-    instance of the Ranker class."""
+    instance of the Ranker class. Compressed files are decompressed while
+    they are read and compiled files are loaded directly."""
 
     try:
-        with open(filename, "r") as f:
-            for game_results in f:
-                ranker.processGameResultsString(game_results)
+        if isCompiledFile(filename):
+            loadCompiledFile(filename, ranker)
+            return
+
+        for game_results in readInputFile(filename):
+            ranker.processGameResultsString(game_results)
 
     except Exception as Err:
         handleError(Err)
 
 
+def processInputFiles(filenames: list[str], ranker: Ranker) -> None:
+    """Game results are read from multiple files concurrently, and the points
+    earned by each team in each file are added to an instance of the Ranker 
+    class in the order of the files, giving the same result as processing the
+    files one after another. An ApproximateRanker depends on the order of 
+    game results and keeps bounded memory, so its files are processed one 
+    after another, game by game."""
+
+    if len(filenames) == 1 or isinstance(ranker, ApproximateRanker):
+        for filename in filenames:
+            processInputFile(filename, ranker)
+        return
+
+    try:
+        for filename, tally in tallyInputFiles(filenames):
+            try:
+                team_points = tally.result()
+            except Exception as Err:
+                handleError(f"Input file '{filename}': {Err}")
+
+            for team_name, points in team_points.items():
+                ranker.addTeamPoints(team_name, points)
+
+    except Exception as Err:
+        handleError(Err)
+
+
+def compileInputFile(input_file: str, output_file: str) -> None:
+    """Game results are read from an input file and written to a compiled 
+    file, which can be used as an input file for faster processing."""
+
+    try:
+        team_count, record_count = compileResultsFile(input_file, output_file)
+        print(f"Compiled {record_count} game results for {team_count} teams to '{output_file}'.")
+
+    except Exception as Err:
+        handleError(Err)
+
+
+def checkGameResultsFile(filename: str) -> None:
+    """Game results in a file are validated without computing the ranking 
+    table, and every invalid line is output to the command line console 
+    followed by a summary."""
+
+    try:
+        line_count, errors = checkInputFile(filename)
+
+    except Exception as Err:
+        handleError(Err)
+
+    lines = [f"Line {line_number}: {message}" for line_number, message in errors]
+    lines.append(f"Checked {line_count} lines in '{filename}': {len(errors)} invalid.")
+    printDivider()
+    print(*lines, sep="\n", end="\n")
+    printDivider()
+
+
 def processCommandlineInput(ranker: Ranker) -> None:
     """Game results are read line-by-line from the command prompt and 
     processed by an instance of the Ranker class."""
@@ -61,18 +129,73 @@ def processCommandlineInput(ranker: Ranker) -> None:
             handleError(Err)
 
 
-def outputToFile(ranker: Ranker, output_file: str) -> None:
+def outputToFile(ranker: Ranker, output_file: str) -> str:
     """Game results are obtained from an instance of the Ranker class and 
-    output to a file. The file is overwritten if it exists."""
+    output to a file. The file is overwritten if it exists. Returns the 
+    ranking table written to the file."""
+
+    lines = "\n".join(ranker.getRankingListStrings())
+    outputTableToFile(lines, output_file)
+
+    return lines
+
+
+def outputDeltaToFile(ranker: Ranker, output_file: str, delta_file: str) -> None:
+    """The ranking table is obtained from an instance of the Ranker class and 
+    compared with the ranking table previously output to output_file. Only
+    changed rows are output to delta_file, then the full ranking table is
+    output to output_file. Both files are overwritten if they exist."""
 
     try:
-        with open(output_file, "w") as f:
-            lines = "\n".join(ranker.getRankingListStrings())
+        if os.path.exists(output_file):
+            with open(output_file, "r") as f:
+                ranker.loadEmittedTable(f.readlines())
+
+        delta_strings = ranker.emitRankingDelta()
+        with open(delta_file, "w") as f:
+            lines = "\n".join(delta_strings)
             f.writelines(lines)
 
     except Exception as Err:
         handleError(Err)
 
+    outputToFile(ranker, output_file)
+
+
+def outputErrorBounds(ranker: ApproximateRanker) -> None:
+    """The error bounds of an approximate ranking table are obtained from an 
+    instance of the ApproximateRanker class and output to the command line
+    console."""
+
+    lines = ranker.getErrorBoundStrings()
+    lines.insert(0, f"Approximate ranking of the top {ranker.top_k} teams, keeping {ranker.capacity} teams.")
+    lines.insert(1, f"Teams with more than {ranker.getGuaranteedPoints()} pts are guaranteed to be kept.")
+    lines.insert(2, f"Teams marked '{ranker.UncertainRowMarker.strip()}' may not be among the top {ranker.top_k} teams.")
+    lines.insert(3, "Points ranges of ranked teams:")
+    printDivider()
+    print(*lines, sep="\n", end="\n")
+    printDivider()
+
+
+def outputTableToFile(table: str, output_file: str) -> None:
+    """A formatted ranking table is output to a file. The file is overwritten
+    if it exists."""
+
+    try:
+        with open(output_file, "w") as f:
+            f.writelines(table)
+
+    except Exception as Err:
+        handleError(Err)
+
+
+def outputCacheStatistics(cache: RankingCache, hit: bool) -> None:
+    """Ranking cache hit and miss counters are output to the command line 
+    console."""
+
+    result = "hit" if hit else "miss"
+    print(f"Ranking cache {result} (hits: {cache.hits}, misses: {cache.misses}).")
+
 
 def outputToCommandline(ranker: Ranker) -> None:
     """Game results are obtained from an instance of the Ranker class and 
@@ -92,19 +215,55 @@ def main(args) -> None:
 
     program_options = parseArguments(args)
 
-    ranker = Ranker()
+    # Compile game results without computing the ranking table
+    if program_options["Mode"] == Modes.COMPILE:
+        compileInputFile(program_options["Input_file"], program_options["Output_file"])
+        return
+
+    # Validate game results without computing the ranking table
+    if program_options["Mode"] == Modes.CHECK:
+        checkGameResultsFile(program_options["Input_file"])
+        return
+
+    top_k = program_options.get("Top_k")
+    ranker = Ranker() if top_k is None else \
+        ApproximateRanker(top_k, top_k * config["approximate_counters_per_team"])
+    input_files = program_options.get("Input_files", [program_options.get("Input_file")])
+
+    # Output a cached ranking table if the input file was ranked before. 
+    # Delta output needs the computed ranking list, and approximate rankings
+    # differ by the number of top teams, so both bypass the cache.
+    cache = None
+    delta_file = program_options.get("Delta_file")
+    if program_options["Mode"] == Modes.FILE_IO and config["cache_enabled"] \
+            and delta_file is None and top_k is None:
+        cache = RankingCache(config["cache_path"], config["cache_max_bytes"])
+        fingerprint = cache.getFingerprint(input_files, ranker)
+        table = cache.get(fingerprint)
+        outputCacheStatistics(cache, table is not None)
+
+        if table is not None:
+            outputTableToFile(table, program_options["Output_file"])
+            return
     
     # Input game results
     if program_options["Mode"] == Modes.FILE_IO:
-        processInputFile(program_options["Input_file"], ranker)
+        processInputFiles(input_files, ranker)
     else:
         processCommandlineInput(ranker)
 
     # Output the ranking table
     if program_options["Mode"] == Modes.COMMAND_LINE_ONLY:
         outputToCommandline(ranker)
+    elif delta_file is not None:
+        outputDeltaToFile(ranker, program_options["Output_file"], delta_file)
     else:
-        outputToFile(ranker, program_options["Output_file"])
+        table = outputToFile(ranker, program_options["Output_file"])
+        if cache is not None:
+            cache.put(fingerprint, table)
+
+    if top_k is not None:
+        outputErrorBounds(ranker)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,174 @@
+"""approximate_ranker.py module
+
+This module defines the ApproximateRanker class that maintains the top teams
+of a league ranking list in a fixed amount of memory, regardless of how many
+distinct teams appear in the game results.
+
+"""
+
+import heapq
+from typing import Optional
+
+from .ranker import Ranker
+from .team import Team
+
+class ApproximateRanker(Ranker):
+    """Class to maintain an approximate league ranking list of the teams with
+    the most points, using the Space-Saving algorithm. At most 'capacity' 
+    teams are kept. When a result is received for a team that is not kept 
+    while all places are taken, the kept team with the fewest points is 
+    replaced by it, and the replaced team's points are carried over as the
+    new team's error bound.
+
+    Each kept team's points are never underestimated, and are overestimated
+    by at most its error bound. Every team with more points than the total
+    points awarded divided by capacity is guaranteed to be kept.
+
+    Only the top_k kept teams are ranked, and keeping many more teams than 
+    top_k narrows their error bounds. A ranked team is marked as uncertain
+    unless its fewest possible points exceed the most points of any team
+    outside the top_k, as it may then not be among the top_k teams."""
+
+    # Stale heap entries are discarded when the heap grows beyond this 
+    # multiple of the capacity
+    HeapGrowthFactor = 4
+
+    # Appended to the rows of ranked teams that may not be among the top_k
+    UncertainRowMarker = " (uncertain)"
+
+    def __init__(self, top_k: int, capacity: Optional[int] = None) -> None:
+        """Initializes an empty list of at most capacity Team instances, to 
+        rank the top_k teams. The capacity defaults to top_k."""
+
+        if capacity is None:
+            capacity = top_k
+
+        if top_k < 1:
+            raise ValueError(f"Number of top teams must be a positive integer (got {top_k}).")
+        if capacity < top_k:
+            raise ValueError(f"Approximate ranking capacity must be at least the number of top teams (got {capacity} < {top_k}).")
+
+        super().__init__()
+        self.top_k = top_k
+        self.capacity = capacity
+        self.total_points = 0
+
+        # Most points a team that is not kept may have, or None if every 
+        # team is kept
+        self.unkept_points: Optional[int] = None
+        self.team_index: dict[str, Team] = {}
+        self.errors: dict[str, int] = {}
+
+        # Min-heap of (points, team name) entries. Entries become stale when
+        # a team's points change or the team is replaced, and are discarded 
+        # lazily when the team with the fewest points is looked up
+        self.heap: list[tuple[int, str]] = []
+
+    def getTeam(self, team_name: str) -> Team:
+        """Finds and returns an instance of a kept Team. If the requested team
+        is not kept, a Team with no points is returned without being kept."""
+
+        team = self.team_index.get(team_name)
+        return team if team is not None else Team(team_name)
+
+    def addTeamPoints(self, team_name: str, points_earned: int) -> None:
+        """Increments a kept team's points with points_earned. A team that is
+        not kept is added if there is room, else it replaces the kept team 
+        with the fewest points."""
+
+        self.total_points += points_earned
+
+        team = self.team_index.get(team_name)
+        if team is None:
+            if len(self.teams) < self.capacity:
+                team = Team(team_name)
+                self.teams.append(team)
+                self.errors[team_name] = 0
+            elif points_earned == 0:
+                # Results earning no points cannot displace a kept team
+                if self.unkept_points is None:
+                    self.unkept_points = 0
+                return
+            else:
+                team = self.popFewestPointsTeam()
+                self.unkept_points = max(self.unkept_points or 0, team.points)
+                del self.team_index[team.name], self.errors[team.name]
+                self.discardRankedTeam(team.name)
+
+                # The replaced team's points are the new team's error bound
+                team.name = team_name
+                self.errors[team_name] = team.points
+
+            self.team_index[team_name] = team
+
+        team.points += points_earned
+        self.markTeamChanged(team)
+
+        heapq.heappush(self.heap, (team.points, team_name))
+        if len(self.heap) > self.HeapGrowthFactor * self.capacity:
+            self.heap = [(team.points, team.name) for team in self.teams]
+            heapq.heapify(self.heap)
+
+    def popFewestPointsTeam(self) -> Team:
+        """Removes and returns the kept team with the fewest points from the 
+        heap, discarding stale heap entries."""
+
+        while True:
+            points, team_name = heapq.heappop(self.heap)
+            team = self.team_index.get(team_name)
+            if team is not None and team.points == points:
+                return team
+
+    def getErrorBound(self, team_name: str) -> Optional[int]:
+        """Returns the most points a kept team's points may be overestimated 
+        by, or None if the team is not kept."""
+
+        return self.errors.get(team_name)
+
+    def getGuaranteedPoints(self) -> int:
+        """Returns the points above which a team is guaranteed to be kept."""
+
+        return self.total_points // self.capacity
+
+    def getUnrankedPoints(self, ranking_list: list[ Team ]) -> Optional[int]:
+        """Returns the most points a team outside the top_k teams of a ranking
+        list may have, or None if there are no such teams."""
+
+        points = [team.points for team in ranking_list[self.top_k:self.top_k + 1]]
+        if self.unkept_points is not None:
+            points.append(self.unkept_points)
+
+        return max(points, default=None)
+
+    def getUncertainMarker(self, team: Team, unranked_points: Optional[int]) -> str:
+        """Returns the marker for a ranked team that may not be among the 
+        top_k teams, or an empty string if it is guaranteed to be."""
+
+        if unranked_points is None or team.points - self.errors[team.name] > unranked_points:
+            return ""
+        else:
+            return self.UncertainRowMarker
+
+    def getRankingListStrings(self) -> list[str]:
+        """Obtains the current ranking list, and returns its top_k teams as a
+        formatted list of strings, marking teams that may not be among them"""
+
+        ranking_list = self.getRankingList()
+
+        if not ranking_list:
+            return ["There are no teams to rank"]
+        else:
+            unranked_points = self.getUnrankedPoints(ranking_list)
+            return [self.getTeamRankingString(team) + self.getUncertainMarker(team, unranked_points) 
+                    for team in ranking_list[:self.top_k]]
+
+    def getErrorBoundStrings(self) -> list[str]:
+        """Obtains the current ranking list, and returns the error bound of 
+        each of its top_k teams as a formatted list of strings"""
+
+        ranking_list = self.getRankingList()
+        unranked_points = self.getUnrankedPoints(ranking_list)
+
+        return [f"{team.rank}. {team.name}, {team.points - self.errors[team.name]}-{team.points} pts" 
+                + self.getUncertainMarker(team, unranked_points) 
+                for team in ranking_list[:self.top_k]]
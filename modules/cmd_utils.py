@@ -10,9 +10,11 @@ This module provides the following:
 """
 
 import os
+import glob
 import json
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
+from .file_reader import isCompressedFile
 
 # Create configuration object from JSON file
 with open(os.path.join("modules", "config.json"), "r") as f:
@@ -23,6 +25,8 @@ class Modes(Enum):
     FILE_IO = 1
     COMMAND_LINE_ONLY = 2
     COMMAND_LINE_FILEOUT = 3
+    COMPILE = 4
+    CHECK = 5
 
 
 def printHelpString() -> None:
@@ -39,17 +43,61 @@ Usage:
 python league_ranker.py [-h|--help]
 python league_ranker.py <input_filepath> [<output_path_or_file>]
 python league_ranker.py [-o <output_path_or_file>]
+python league_ranker.py compile <input_filepath> [<compiled_file>]
+python league_ranker.py -d <input_filepath> [<output_path_or_file>]
+python league_ranker.py -k <top_k> <input_filepath> [<output_path_or_file>]
+python league_ranker.py --check <input_filepath>
+python league_ranker.py -m <output_path_or_file> <input_path> [<input_path> ...]
 
 Options:
     -h, --help                  Displays this help message.
 
     input_filepath              Identifies input filepath or file location.
+                                A directory or a glob pattern (in quotes) 
+                                can be used to input all the files it holds
+                                or matches, except with compile or --check.
+                                Compiled files and the output file are not
+                                input from a directory.
+                                Files compressed with gzip (.gz), bzip2 (.bz2)
+                                or xz (.xz) are read without decompressing
+                                them to disk first. Compiled files are
+                                loaded directly.
 
     output_path_or_file         Optional output filename or file location.
 
     -o                          Command line parser is used to input game 
                                 results, but ranking table is sent to a file. 
 
+    compile                     Converts game results in input_filepath to a
+                                compiled binary file that is loaded faster 
+                                than text. The compiled file defaults to the
+                                input filename with extension '.lrb'.
+
+    -d                          The ranking table is compared with the table
+                                already in the output file, and only changed
+                                rows (rank or points changes and new teams) 
+                                are sent to a delta file named after the 
+                                output file with suffix '_delta'. The output 
+                                file is then updated with the full table.
+
+    -k                          Only the top_k teams by points are ranked, in
+                                a fixed amount of memory for any number of 
+                                teams. Points may be overestimated, and the
+                                error bounds are displayed. Teams that may 
+                                not be among the top_k are marked 
+                                '(uncertain)'. Compiled files are not 
+                                accepted; use the text file instead.
+
+    --check                     Game results in input_filepath are validated
+                                in parallel without computing the ranking 
+                                table. Every invalid line is displayed with 
+                                its line number, followed by a summary.
+
+    -m                          Game results are input from multiple input 
+                                paths (files, directories or glob patterns),
+                                and the ranking table is sent to a file. Use
+                                "" as output_path_or_file for the default.
+
     When no options or arguments are provided, the command line parser is used
     to input game results, and the ranking table is also printed to the console. 
 """
@@ -107,12 +155,26 @@ def parsePath(filepath: str) -> tuple[str, str, str]:
 
 def validateInputFile(input_file: str) -> str:
     """Validates the existence of an input file, and checks if it is a valid
-    file format."""
+    file format. Compressed input files are accepted if the file they contain
+    has a valid file format. Compiled input files are accepted unless they are
+    compressed, as they are memory-mapped rather than read as text."""
 
     if not os.path.exists(input_file):
         raise Exception(f"Input path '{input_file}' does not exist.")
 
-    _, _, input_extension = parsePath(input_file)
+    input_dir, input_basename, input_extension = parsePath(input_file)
+
+    # Compressed files are validated against the extension of the file they
+    # contain, e.g. 'results.txt.gz' is validated as 'results.txt'
+    compressed = isCompressedFile(input_file)
+    if compressed:
+        _, _, input_extension = parsePath(os.path.join(input_dir, input_basename))
+
+    if input_extension == config["compiled_file_extension"]:
+        if compressed:
+            raise Exception(f"Compiled input file '{input_file}' must not be compressed.")
+        return input_file
+
     if input_extension not in config["valid_file_extensions"]: 
         i_string = input_extension if input_extension else "empty string"
         i_string = f"Invalid extension '{i_string}' found.\n"
@@ -122,9 +184,85 @@ def validateInputFile(input_file: str) -> str:
     return input_file
 
 
-def validateOutputFile(output_file: str) -> str:
+def getResultsBasePath(input_file: str) -> str:
+    """Returns an input file's path without its file format and compression
+    extensions, which a text file and its compiled copy have in common."""
+
+    input_dir, input_basename, _ = parsePath(input_file)
+    if isCompressedFile(input_file):
+        input_dir, input_basename, _ = parsePath(os.path.join(input_dir, input_basename))
+
+    return os.path.join(input_dir, input_basename)
+
+
+def validateInputPaths(input_paths: list[str], excluded_files: Optional[list[str]] = None) -> list[str]:
+    """Resolves input paths, which may be files, directories or glob patterns,
+    to a list of validated input files. Text or compressed files in a 
+    directory (excluding sub directories and compiled files), and files 
+    matching a glob pattern, are added in alphabetical order. Files are only
+    added once, and excluded files (such as the output file) are never added
+    from a directory or glob pattern. Raises an exception if a text file and
+    its compiled copy are both input, as their game results would be counted
+    twice."""
+
+    excluded_files = {os.path.abspath(excluded_file) for excluded_file in excluded_files or []}
+
+    input_files = []
+    for input_path in input_paths:
+        if os.path.isdir(input_path):
+            for filename in sorted(os.listdir(input_path)):
+                input_file = os.path.join(input_path, filename)
+                if not os.path.isfile(input_file) or os.path.abspath(input_file) in excluded_files \
+                        or parsePath(input_file)[2] == config["compiled_file_extension"]:
+                    continue
+
+                try:
+                    input_files.append(validateInputFile(input_file))
+                except Exception:
+                    pass
+
+        elif not os.path.exists(input_path) and any(char in input_path for char in "*?["):
+            matched_files = [input_file for input_file in sorted(glob.glob(input_path, recursive=True))
+                             if os.path.isfile(input_file) and os.path.abspath(input_file) not in excluded_files]
+            if not matched_files:
+                raise Exception(f"Input pattern '{input_path}' does not match any files.")
+            input_files.extend(validateInputFile(input_file) for input_file in matched_files)
+
+        else:
+            input_files.append(validateInputFile(input_path))
+
+    if not input_files:
+        raise Exception(f"No input files found in {input_paths}.")
+
+    input_files = list(dict.fromkeys(input_files))
+
+    base_paths = {}
+    for input_file in input_files:
+        other_file = base_paths.setdefault(getResultsBasePath(input_file), input_file)
+        other_is_compiled = parsePath(other_file)[2] == config["compiled_file_extension"]
+        is_compiled = parsePath(input_file)[2] == config["compiled_file_extension"]
+        if other_is_compiled != is_compiled:
+            raise Exception(f"Input files '{other_file}' and '{input_file}' hold the same game results. Input only one of them.")
+
+    return input_files
+
+
+def getInputFileOptions(input_paths: list[str], excluded_files: Optional[list[str]] = None
+                        ) -> dict[str, Union[str, list[str]]]:
+    """Resolves input paths to input files, and returns them as program 
+    options: 'Input_file' for a single input file, else 'Input_files'."""
+
+    input_files = validateInputPaths(input_paths, excluded_files)
+
+    if len(input_files) == 1:
+        return {"Input_file": input_files[0]}
+    else:
+        return {"Input_files": input_files}
+
+
+def validateOutputFile(output_file: str, warn_if_exists: bool = True) -> str:
     """Checks if an output filename is provided and well formed, else it 
-    provides default file parts. Warns if the file is existing."""
+    provides default file parts. Optionally warns if the file is existing."""
 
     if not output_file in (None, ""):
         output_dir, output_filename, output_ext = parsePath(output_file)
@@ -148,12 +286,55 @@ def validateOutputFile(output_file: str) -> str:
             config["default_output_path"], config["default_output_filename"], config["default_output_extension"]
 
     output_file = os.path.join(output_dir, output_filename + output_ext)
-    if os.path.exists(output_file):
+    if warn_if_exists and os.path.exists(output_file):
         handleWarning(f"Output file '{output_file}' exists. It will be overwritten")
 
     return output_file
 
 
+def validateCompiledFile(compiled_file: str, input_file: str) -> str:
+    """Checks if a compiled output filename is provided and has the compiled
+    file extension, else it is derived from the input filename. Warns if the 
+    file is existing."""
+
+    if compiled_file in (None, ""):
+        compiled_file = getResultsBasePath(input_file) + config["compiled_file_extension"]
+
+    else:
+        compiled_dir, compiled_basename, compiled_ext = parsePath(compiled_file)
+        if compiled_ext != config["compiled_file_extension"]:
+            i_string = compiled_ext if compiled_ext != "" else "empty string"
+            compiled_ext = config["compiled_file_extension"]
+            i_string = f"Invalid compiled file extension '{i_string}' found.\n"
+            i_string += f"Defaulting to extension '{compiled_ext}'"
+            handleWarning(i_string)
+            compiled_file = os.path.join(compiled_dir, compiled_basename + compiled_ext)
+
+    if os.path.exists(compiled_file):
+        handleWarning(f"Compiled file '{compiled_file}' exists. It will be overwritten")
+
+    return compiled_file
+
+
+def validateTopK(top_k: str) -> int:
+    """Validates that the number of top teams to rank is a positive 
+    integer."""
+
+    if not top_k.isdigit() or int(top_k) < 1:
+        raise Exception(f"Number of top teams '{top_k}' is not a positive integer.")
+
+    return int(top_k)
+
+
+def getDeltaFile(output_file: str) -> str:
+    """Derives the filename that ranking table changes are output to from the
+    ranking table output filename."""
+
+    output_dir, output_filename, output_ext = parsePath(output_file)
+
+    return os.path.join(output_dir, output_filename + config["delta_file_suffix"] + output_ext)
+
+
 def parseArguments(args: list[str]) -> dict[Modes, Optional[str], Optional[str]]:
     """Parses the command line arguments and determines the correct program
     logic (mode) to apply, and also resolves input/output files if required"""
@@ -180,6 +361,81 @@ def parseArguments(args: list[str]) -> dict[Modes, Optional[str], Optional[str]]
             output_file = validateOutputFile(output_file)
 
             return {"Mode": Modes.COMMAND_LINE_FILEOUT, "Output_file": output_file}
+        elif args[0] == "compile":
+            # convert an input file to the compiled binary format
+            _, *files = args
+
+            if len(files) == 0:
+                raise Exception("No input file received to compile.")
+            elif len(files) > 2:
+                handleWarning(f"Too many arguments received. Discarding: {files[1:-1]}") 
+
+            input_file = validateInputFile(files[0])
+            output_file = validateCompiledFile(files[-1] if len(files) > 1 else None, input_file)
+
+            return {"Mode": Modes.COMPILE, "Input_file": input_file, "Output_file": output_file}
+        elif args[0] == "--check":
+            # validate an input file without computing the ranking table
+            _, *files = args
+
+            if len(files) == 0:
+                raise Exception("No input file received to check.")
+            elif len(files) > 1:
+                handleWarning(f"Too many arguments received. Discarding: {files[1:]}") 
+
+            input_file = validateInputFile(files[0])
+
+            return {"Mode": Modes.CHECK, "Input_file": input_file}
+        elif args[0] == "-d":
+            # proceed using files for input and output, and send the changes
+            # since the ranking table previously in the output file to a file
+            _, *files = args
+
+            if len(files) == 0:
+                raise Exception("No input file received for delta output.")
+            elif len(files) > 2:
+                handleWarning(f"Too many arguments received. Discarding: {files[1:-1]}") 
+
+            output_file = validateOutputFile(files[-1] if len(files) > 1 else None, warn_if_exists=False)
+            delta_file = getDeltaFile(output_file)
+            input_options = getInputFileOptions(files[:1], [output_file, delta_file])
+
+            return {"Mode": Modes.FILE_IO, **input_options, "Output_file": output_file, "Delta_file": delta_file}
+        elif args[0] == "-k":
+            # proceed using files for input and output, but only keep an
+            # approximate ranking of the top teams in bounded memory
+            _, *files = args
+
+            if len(files) < 2:
+                raise Exception("Number of top teams and input file are required for approximate ranking.")
+            elif len(files) > 3:
+                handleWarning(f"Too many arguments received. Discarding: {files[2:-1]}") 
+
+            top_k = validateTopK(files[0])
+            output_file = validateOutputFile(files[-1] if len(files) > 2 else None)
+            input_options = getInputFileOptions(files[1:2], [output_file, getDeltaFile(output_file)])
+
+            # Compiled files hold a dictionary of every team name, so they
+            # cannot be ranked in bounded memory
+            input_files = input_options.get("Input_files", [input_options.get("Input_file")])
+            compiled_files = [input_file for input_file in input_files
+                              if parsePath(input_file)[2] == config["compiled_file_extension"]]
+            if compiled_files:
+                raise Exception(f"Compiled files cannot be ranked approximately: {compiled_files}")
+
+            return {"Mode": Modes.FILE_IO, **input_options, "Output_file": output_file, "Top_k": top_k}
+        elif args[0] == "-m":
+            # proceed using multiple input paths, and send output to file
+            _, *files = args
+
+            if len(files) < 2:
+                raise Exception("Output file and at least one input path are required for multiple input paths.")
+
+            output_file, *input_paths = files
+            output_file = validateOutputFile(output_file)
+            input_options = getInputFileOptions(input_paths, [output_file, getDeltaFile(output_file)])
+
+            return {"Mode": Modes.FILE_IO, **input_options, "Output_file": output_file}
         else:
             # proceed using files for input and output
             input_file, *output_file = args
@@ -189,10 +445,10 @@ def parseArguments(args: list[str]) -> dict[Modes, Optional[str], Optional[str]]
 
             output_file = output_file[-1] if len(output_file) > 0 else None
 
-            input_file = validateInputFile(input_file)
             output_file = validateOutputFile(output_file)
+            input_options = getInputFileOptions([input_file], [output_file, getDeltaFile(output_file)])
 
-            return {"Mode": Modes.FILE_IO, "Input_file": input_file, "Output_file": output_file}
+            return {"Mode": Modes.FILE_IO, **input_options, "Output_file": output_file}
 
     except Exception as Err:
         handleError(Err)
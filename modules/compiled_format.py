@@ -0,0 +1,142 @@
+"""compiled_format.py module
+
+This module converts game results to and from a compact binary format, so
+that results can be reloaded without parsing text on every run.
+
+A compiled file consists of:
+1.  A fixed size header holding a magic number, the format version, the
+    number of teams, the number of game results and the size of the team
+    name dictionary.
+2.  The team name dictionary: UTF-8 encoded team names separated by newlines
+    and padded to a multiple of 4 bytes. A team's id is its position in the
+    dictionary.
+3.  Fixed-width game result records of four little-endian unsigned 32-bit
+    integers: team 1 id, team 1 score, team 2 id and team 2 score.
+"""
+
+import os
+import sys
+import mmap
+import struct
+from array import array
+
+from .cmd_utils import config
+from .ranker import Ranker
+from .approximate_ranker import ApproximateRanker
+from .file_reader import readInputFile
+
+# Binary layout of the compiled file format
+MagicNumber = b"LRNK"
+FormatVersion = 1
+HeaderFormat = struct.Struct("<4sHHIII")
+RecordFormat = struct.Struct("<IIII")
+RecordFields = 4
+MaxValue = 2**32 - 1
+
+# Records can be viewed in place when the platform's native unsigned int
+# matches the little-endian 32-bit layout of the file
+NativeRecordLayout = sys.byteorder == "little" and array("I").itemsize == 4
+
+
+def isCompiledFile(filename: str) -> bool:
+    """Checks if a file is a compiled game results file, based on its file
+    extension. The magic number confirms the format when the file is 
+    loaded."""
+
+    _, ext = os.path.splitext(filename)
+    return ext == config["compiled_file_extension"]
+
+
+def compileResultsFile(input_file: str, output_file: str) -> tuple[int, int]:
+    """Parses game results from an input file and writes them to an output 
+    file in the compiled binary format. Returns the number of teams and 
+    game results compiled."""
+
+    parser = Ranker()
+    team_ids: dict[str, int] = {}
+    records = array("I") if NativeRecordLayout else array("L")
+
+    for game_results in readInputFile(input_file):
+        team1_name, team1_score, team2_name, team2_score = \
+            parser.parseGameResultsString(game_results)
+
+        if team1_score > MaxValue or team2_score > MaxValue:
+            raise ValueError(f"INVALID ENTRY: Team score too large to compile (maximum is {MaxValue}).")
+
+        team1_id = team_ids.setdefault(team1_name, len(team_ids))
+        team2_id = team_ids.setdefault(team2_name, len(team_ids))
+        records.extend((team1_id, team1_score, team2_id, team2_score))
+
+    names = "\n".join(team_ids).encode("utf-8")
+    padding = b"\0" * (-len(names) % 4)
+    record_count = len(records) // RecordFields
+
+    with open(output_file, "wb") as f:
+        f.write(HeaderFormat.pack(MagicNumber, FormatVersion, 0, 
+                                  len(team_ids), record_count, len(names)))
+        f.write(names + padding)
+
+        if NativeRecordLayout:
+            records.tofile(f)
+        else:
+            for index in range(0, len(records), RecordFields):
+                f.write(RecordFormat.pack(*records[index:index+RecordFields]))
+
+    return len(team_ids), record_count
+
+
+def loadCompiledFile(filename: str, ranker: Ranker) -> None:
+    """Loads game results from a compiled file into an instance of the Ranker 
+    class. The file is memory-mapped and its records are read in place, with 
+    points tallied per team id before they are added to the ranker. Raises 
+    a ValueError exception for an ApproximateRanker, as the tallies hold every
+    team's points rather than a bounded number."""
+
+    if isinstance(ranker, ApproximateRanker):
+        raise ValueError(f"Compiled file '{filename}' cannot be loaded by an approximate ranker.")
+
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if len(mm) < HeaderFormat.size:
+                raise ValueError(f"Compiled file '{filename}' is truncated.")
+
+            magic, version, _, team_count, record_count, names_size = \
+                HeaderFormat.unpack_from(mm)
+            if magic != MagicNumber:
+                raise ValueError(f"File '{filename}' is not a compiled game results file.")
+            if version != FormatVersion:
+                raise ValueError(f"Compiled file '{filename}' has unsupported version {version} (expected {FormatVersion}).")
+
+            records_offset = HeaderFormat.size + names_size + (-names_size % 4)
+            records_end = records_offset + record_count * RecordFormat.size
+            if len(mm) < records_end:
+                raise ValueError(f"Compiled file '{filename}' is truncated.")
+
+            names_bytes = mm[HeaderFormat.size:HeaderFormat.size + names_size]
+            team_names = names_bytes.decode("utf-8").split("\n") if team_count else []
+            team_points = [0] * team_count
+
+            with memoryview(mm) as view:
+                with view[records_offset:records_end] as records_view:
+                    if NativeRecordLayout:
+                        with records_view.cast("I") as records:
+                            tallyRecords(records, team_points, ranker)
+                    else:
+                        records = [value for record in RecordFormat.iter_unpack(records_view) for value in record]
+                        tallyRecords(records, team_points, ranker)
+
+    for team_name, points in zip(team_names, team_points):
+        ranker.addTeamPoints(team_name, points)
+
+
+def tallyRecords(records, team_points: list[int], ranker: Ranker) -> None:
+    """Accumulates the points earned by each team id from a flat sequence of
+    game result records."""
+
+    team1_ids, team1_scores = records[0::RecordFields], records[1::RecordFields]
+    team2_ids, team2_scores = records[2::RecordFields], records[3::RecordFields]
+
+    for team1_id, team1_score, team2_id, team2_score in \
+            zip(team1_ids, team1_scores, team2_ids, team2_scores):
+        team_points[team1_id] += ranker.getPointsEarned(team1_score, team2_score)
+        team_points[team2_id] += ranker.getPointsEarned(team2_score, team1_score)
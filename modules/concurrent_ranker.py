@@ -0,0 +1,168 @@
+"""concurrent_ranker.py module
+
+This module defines the ConcurrentRanker class, a Ranker that game results
+can be added to from many threads at once, including on free-threaded 
+Python builds.
+
+"""
+
+import weakref
+import threading
+
+from .ranker import Ranker
+from .team import Team
+
+class PointsAccumulator:
+    """Class to accumulate the points earned by teams in a single thread, 
+    until they are merged into the shared list of teams."""
+
+    def __init__(self) -> None:
+        """Initializes an empty collection of points per team name for the 
+        calling thread. The lock is only contended while the points are being
+        merged."""
+
+        self.lock = threading.Lock()
+        self.points: dict[str, int] = {}
+        self.thread = weakref.ref(threading.current_thread())
+
+    def isThreadAlive(self) -> bool:
+        """Checks if the thread that owns this accumulator is still alive."""
+
+        thread = self.thread()
+        return thread is not None and thread.is_alive()
+
+
+class ConcurrentRanker(Ranker):
+    """Class to create and maintain a list of teams and provide a league 
+    ranking list, where game results may be added concurrently by multiple
+    threads.
+
+    Each thread adds points to its own PointsAccumulator, so threads adding 
+    game results do not contend with each other. Accumulated points are 
+    merged into the list of teams whenever teams or the ranking list are 
+    read, so the teams list must not be read directly while game results 
+    are being added."""
+
+    def __init__(self) -> None:
+        """Initializes an empty list of Team instances, and an empty list of
+        per-thread points accumulators."""
+
+        super().__init__()
+        self.team_index: dict[str, Team] = {}
+        self.accumulators: list[PointsAccumulator] = []
+        self.thread_data = threading.local()
+
+        # Guards the teams, the accumulators list and the ranking computation
+        self.merge_lock = threading.RLock()
+
+    def getAccumulator(self) -> PointsAccumulator:
+        """Returns the calling thread's points accumulator, registering a new
+        one on the thread's first call."""
+
+        accumulator = getattr(self.thread_data, "accumulator", None)
+        if accumulator is None:
+            accumulator = PointsAccumulator()
+            self.thread_data.accumulator = accumulator
+            with self.merge_lock:
+                self.accumulators.append(accumulator)
+
+        return accumulator
+
+    def addTeamPoints(self, team_name: str, points_earned: int) -> None:
+        """Increments a team's points with points_earned in the calling 
+        thread's accumulator."""
+
+        accumulator = self.getAccumulator()
+        with accumulator.lock:
+            accumulator.points[team_name] = accumulator.points.get(team_name, 0) + points_earned
+
+    def mergeAccumulators(self) -> None:
+        """Moves the points in every thread's accumulator into the list of
+        teams, creating teams that are not found. Accumulators of threads 
+        that have exited are removed once their points are merged."""
+
+        with self.merge_lock:
+            live_accumulators = []
+            for accumulator in self.accumulators:
+                # A thread that has exited adds no more points after this
+                # check, so its accumulator is empty once merged
+                if accumulator.isThreadAlive():
+                    live_accumulators.append(accumulator)
+
+                with accumulator.lock:
+                    points, accumulator.points = accumulator.points, {}
+
+                for team_name, points_earned in points.items():
+                    team = self.findTeam(team_name)
+                    team.points += points_earned
+                    self.markTeamChanged(team)
+
+            self.accumulators = live_accumulators
+
+    def findTeam(self, team_name: str) -> Team:
+        """Finds and returns an instance of a Team in the teams list without
+        merging accumulated points. If the requested team is not found, a new 
+        Team is instantiated and appended to the teams list"""
+
+        team = self.team_index.get(team_name)
+        if team is None:
+            team = Team(team_name)
+            self.teams.append(team)
+            self.team_index[team_name] = team
+            self.markTeamChanged(team)
+
+        return team
+
+    def getTeam(self, team_name: str) -> Team:
+        """Merges accumulated points, then finds and returns an instance of a
+        Team in the teams list, creating it if it is not found."""
+
+        with self.merge_lock:
+            self.mergeAccumulators()
+            return self.findTeam(team_name)
+
+    def getRankingList(self) -> list[ Team ]:
+        """Merges accumulated points, then calculates the rank of teams and
+        returns a new list of teams sorted according to rank."""
+
+        with self.merge_lock:
+            self.mergeAccumulators()
+            return super().getRankingList()
+
+    def getRankingDelta(self) -> list[ Team ]:
+        """Merges accumulated points, then returns the teams whose rank or
+        points differ from the last emitted ranking table."""
+
+        with self.merge_lock:
+            self.mergeAccumulators()
+            return super().getRankingDelta()
+
+    def markEmitted(self, teams: list[ Team ]) -> None:
+        """Records the rank and points of teams as emitted."""
+
+        with self.merge_lock:
+            super().markEmitted(teams)
+
+    def emitRankingDelta(self) -> list[str]:
+        """Merges accumulated points, then returns the changed rows as 
+        formatted strings and records them as emitted, without points being
+        merged in between."""
+
+        with self.merge_lock:
+            return super().emitRankingDelta()
+
+    def getRankingListStrings(self) -> list[str]:
+        """Merges accumulated points, then returns the ranking list as a 
+        formatted list of strings, without points being merged while the 
+        rows are formatted."""
+
+        with self.merge_lock:
+            return super().getRankingListStrings()
+
+    def __str__(self) -> str:
+        """Merges accumulated points, then returns a string representation of
+        this instance and the teams it contains."""
+
+        with self.merge_lock:
+            self.mergeAccumulators()
+            return super().__str__()
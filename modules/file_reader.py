@@ -0,0 +1,93 @@
+"""file_reader.py module
+
+This module provides functions to read game results from input files:
+1.  Compressed input files (gzip, bzip2 and xz) are decompressed on the fly
+    while they are read, without writing a decompressed copy to disk.
+2.  Plain text input files are read through buffered text-mode reads, with
+    the locale encoding and universal newlines of the original reader.
+3.  Input files can be read whole, and split into lines of game results to
+    be parsed elsewhere.
+"""
+
+import os
+import bz2
+import gzip
+import lzma
+import locale
+from typing import Iterator, TextIO
+
+# Maps supported compressed file extensions to the function used to open them
+CompressedFileOpeners = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+# Encoding used to decode game results read from input files, which is the
+# same locale encoding used by open() in text mode
+InputEncoding = locale.getpreferredencoding(False)
+
+
+def isCompressedFile(filename: str) -> bool:
+    """Checks if a file is compressed, based on its file extension."""
+
+    _, ext = os.path.splitext(filename)
+    return ext.lower() in CompressedFileOpeners
+
+
+def openCompressedFile(filename: str) -> TextIO:
+    """Opens a compressed file for reading as text, selecting the opener for
+    its file extension. The file is decompressed while it is being read."""
+
+    _, ext = os.path.splitext(filename)
+    opener = CompressedFileOpeners[ext.lower()]
+
+    return opener(filename, "rt", encoding=InputEncoding)
+
+
+def readCompressedFile(filename: str) -> Iterator[str]:
+    """Yields game results line-by-line from a compressed file, which is
+    decompressed while it is being read."""
+
+    with openCompressedFile(filename) as f:
+        yield from f
+
+
+def readPlainFile(filename: str) -> Iterator[str]:
+    """Yields game results line-by-line from a plain text file."""
+
+    with open(filename, "r", encoding=InputEncoding) as f:
+        yield from f
+
+
+def readInputText(filename: str) -> str:
+    """Reads all game results from an input file as a single string, 
+    decompressing compressed files. Line endings are translated to '\\n'."""
+
+    if isCompressedFile(filename):
+        with openCompressedFile(filename) as f:
+            return f.read()
+    else:
+        with open(filename, "r", encoding=InputEncoding) as f:
+            return f.read()
+
+
+def splitGameResultsText(text: str) -> list[str]:
+    """Splits game results read as a single string into lines."""
+
+    lines = text.split("\n")
+    # A trailing newline ends the last line rather than starting a new one
+    if lines[-1] == "":
+        lines.pop()
+
+    return lines
+
+
+def readInputFile(filename: str) -> Iterator[str]:
+    """Yields game results line-by-line from an input file, selecting the
+    appropriate reader for compressed or plain text files."""
+
+    if isCompressedFile(filename):
+        return readCompressedFile(filename)
+    else:
+        return readPlainFile(filename)
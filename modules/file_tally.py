@@ -0,0 +1,71 @@
+"""file_tally.py module
+
+This module tallies the points earned by each team in many input files 
+concurrently. Input files are read by a pool of threads, and the game 
+results they contain are parsed by a pool of worker processes. Tallies are
+returned in the order of the input files, so that merging them gives the 
+same result as processing the input files one after another.
+
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Iterator
+
+from .ranker import Ranker
+from .file_reader import readInputText, splitGameResultsText
+from .compiled_format import isCompiledFile, loadCompiledFile
+
+
+def getTeamPoints(ranker: Ranker) -> dict[str, int]:
+    """Returns the points of each team in a ranker, in the order the teams 
+    were first found."""
+
+    return {team.name: team.points for team in ranker.teams}
+
+
+def tallyGameResultsText(text: str) -> dict[str, int]:
+    """Parses newline separated game results, and returns the points earned
+    by each team in the order the teams were first found. Raises a ValueError
+    exception if any game result is invalid."""
+
+    ranker = Ranker()
+    for game_results in splitGameResultsText(text):
+        ranker.processGameResultsString(game_results)
+
+    return getTeamPoints(ranker)
+
+
+def tallyCompiledFile(filename: str) -> dict[str, int]:
+    """Loads a compiled file, and returns the points earned by each team in 
+    the order the teams were first found."""
+
+    ranker = Ranker()
+    loadCompiledFile(filename, ranker)
+
+    return getTeamPoints(ranker)
+
+
+def tallyInputFile(filename: str, parsers: ProcessPoolExecutor) -> dict[str, int]:
+    """Reads an input file and waits for its game results to be tallied by a
+    worker process. Compiled files are loaded by the worker process."""
+
+    if isCompiledFile(filename):
+        return parsers.submit(tallyCompiledFile, filename).result()
+    else:
+        return parsers.submit(tallyGameResultsText, readInputText(filename)).result()
+
+
+def tallyInputFiles(filenames: list[str]) -> Iterator[tuple[str, Future]]:
+    """Yields each input filename with a future of the points earned by each
+    team in it, in the order of the input filenames. Exceptions raised while 
+    reading or parsing an input file are raised by its future's result."""
+
+    with ThreadPoolExecutor() as readers, ProcessPoolExecutor() as parsers:
+        tallies = [readers.submit(tallyInputFile, filename, parsers) 
+                   for filename in filenames]
+
+        try:
+            yield from zip(filenames, tallies)
+        finally:
+            for tally in tallies:
+                tally.cancel()
@@ -5,6 +5,8 @@ and provides a league ranking list.
 
 """
 
+from bisect import bisect_left, bisect_right, insort
+
 from .team import Team
 
 class Ranker:
@@ -18,9 +20,18 @@ class Ranker:
 
     def __init__(self) -> None:
         """Initializes an empty list of Team instances that will grow as 
-        as game results are processed"""
+        as game results are processed. The rank and points of each team in 
+        the last emitted ranking table are kept, along with the teams whose 
+        points changed since, to compute ranking table changes. A sorted 
+        ranking of (-points, name) keys is kept up to date with changed teams,
+        so ranks can be found without rebuilding the ranking list."""
 
         self.teams = []
+        self.emitted_table: dict[str, tuple[int, int]] = {}
+        self.changed_teams: dict[str, Team] = {}
+        self.ranked_keys: list[tuple[int, str]] = []
+        self.ranked_teams: dict[str, tuple[int, Team]] = {}
+        self.unranked_teams: dict[str, Team] = {}
 
     def getPointsEarned(self, this_team_score: int, 
                         other_team_score: int) -> int:
@@ -43,6 +54,7 @@ class Ranker:
 
         new_team: Team = Team(team_name)
         self.teams.append(new_team)
+        self.markTeamChanged(new_team)
 
         return new_team
 
@@ -52,6 +64,14 @@ class Ranker:
 
         team: Team = self.getTeam(team_name)
         team.points += points_earned
+        self.markTeamChanged(team)
+
+    def markTeamChanged(self, team: Team) -> None:
+        """Records that a team's points changed, for the next ranking 
+        delta."""
+
+        self.changed_teams[team.name] = team
+        self.unranked_teams[team.name] = team
 
     def addGameResults(self, team1_name: str, team1_score: int, 
                         team2_name: str, team2_score: int) -> None:
@@ -64,10 +84,9 @@ class Ranker:
         team2_points: int = self.getPointsEarned(team2_score, team1_score)
         self.addTeamPoints(team2_name, team2_points)
 
-    def processGameResultsString(self, game_results: str) -> None:
-        """Parses a string representing a game's result. Calls the 
-        addGameResults method to process game results if successful,
-        else raises a ValueError exception."""
+    def parseGameResultsString(self, game_results: str) -> tuple[str, int, str, int]:
+        """Parses a string representing a game's result. Returns the team 
+        names and scores if successful, else raises a ValueError exception."""
 
         comma_count: int = game_results.count(",")
         if comma_count == 0: 
@@ -101,7 +120,14 @@ class Ranker:
         else:
             raise ValueError("INVALID ENTRY: Team 2 score is not an integer.")
 
-        self.addGameResults(team1_name, team1_score, team2_name, team2_score)
+        return team1_name, team1_score, team2_name, team2_score
+
+    def processGameResultsString(self, game_results: str) -> None:
+        """Parses a string representing a game's result. Calls the 
+        addGameResults method to process game results if successful,
+        else raises a ValueError exception."""
+
+        self.addGameResults(*self.parseGameResultsString(game_results))
 
     def getRankingList(self) -> list[ Team ]:
         """Calculates the rank of teams in the internal collection, and
@@ -144,6 +170,105 @@ class Ranker:
 
         return ranking_list
 
+    def getRankingDelta(self) -> list[ Team ]:
+        """Returns the teams whose rank or points differ from the last emitted
+        ranking table, including new teams, sorted according to rank (and 
+        alphabetically second). Only the ranks of teams that can have changed
+        are computed, using the sorted ranking kept up to date with changed
+        teams, so the full ranking list is not rebuilt."""
+
+        self.updateRankedTeams()
+        if not self.changed_teams:
+            return []
+
+        # A team's rank is one more than the number of teams with more points,
+        # so besides the changed teams themselves, only teams with points 
+        # between a changed team's emitted and current points can change rank.
+        # New teams can change the rank of every team with fewer points.
+        lowest_points = float("inf")
+        highest_points = float("-inf")
+        for team in self.changed_teams.values():
+            emitted = self.emitted_table.get(team.name)
+            emitted_points = float("-inf") if emitted is None else emitted[1]
+            lowest_points = min(lowest_points, emitted_points, team.points)
+            highest_points = max(highest_points, emitted_points, team.points)
+
+        # The sorted ranking is in descending points order, so the teams with
+        # points in [lowest_points, highest_points) form a contiguous slice
+        start = bisect_right(self.ranked_keys, -highest_points, key=lambda key: key[0])
+        end = bisect_right(self.ranked_keys, -lowest_points, key=lambda key: key[0])
+        candidates = {team_name: self.ranked_teams[team_name][1] 
+                      for _, team_name in self.ranked_keys[start:end]}
+        candidates.update(self.changed_teams)
+
+        delta = []
+        for team in candidates.values():
+            team.rank = bisect_left(self.ranked_keys, -team.points, key=lambda key: key[0]) + 1
+            if self.emitted_table.get(team.name) != (team.rank, team.points):
+                delta.append(team)
+        delta.sort(key=lambda team: (team.rank, team.name))
+
+        return delta
+
+    def updateRankedTeams(self) -> None:
+        """Moves the teams whose points changed since the last update to their
+        new position in the sorted ranking."""
+
+        for team in self.unranked_teams.values():
+            ranked = self.ranked_teams.get(team.name)
+            if ranked is not None:
+                del self.ranked_keys[bisect_left(self.ranked_keys, (-ranked[0], team.name))]
+
+            insort(self.ranked_keys, (-team.points, team.name))
+            self.ranked_teams[team.name] = (team.points, team)
+
+        self.unranked_teams.clear()
+
+    def discardRankedTeam(self, team_name: str) -> None:
+        """Removes a team from the sorted ranking and the changed teams."""
+
+        ranked = self.ranked_teams.pop(team_name, None)
+        if ranked is not None:
+            del self.ranked_keys[bisect_left(self.ranked_keys, (-ranked[0], team_name))]
+
+        self.unranked_teams.pop(team_name, None)
+        self.changed_teams.pop(team_name, None)
+
+    def markEmitted(self, teams: list[ Team ]) -> None:
+        """Records the rank and points of teams as emitted, and clears the 
+        changed teams, so that the next ranking delta is computed against 
+        them."""
+
+        for team in teams:
+            self.emitted_table[team.name] = (team.rank, team.points)
+
+        self.changed_teams.clear()
+
+    def emitRankingDelta(self) -> list[str]:
+        """Returns the rows that differ from the last emitted ranking table as
+        a formatted list of strings, and records them as emitted."""
+
+        delta = self.getRankingDelta()
+        delta_strings = [self.getTeamRankingString(team) for team in delta]
+        self.markEmitted(delta)
+
+        return delta_strings
+
+    def loadEmittedTable(self, ranking_strings: list[str]) -> None:
+        """Records the rank and points of each team in a previously emitted
+        ranking table, formatted as by getRankingListStrings. Lines that are
+        not ranking table rows are ignored."""
+
+        for ranking_string in ranking_strings:
+            rank, separator, result = ranking_string.strip().partition(". ")
+            team_name, _, points = result.rpartition(", ")
+            if not separator or not team_name or not points.endswith(" pts"):
+                continue
+
+            points = points[:-len(" pts")]
+            if rank.isdigit() and points.isdigit():
+                self.emitted_table[team_name] = (int(rank), int(points))
+
     def getRankingListStrings(self) -> list[str]:
         """Obtains the current ranking list, and returns it as a formatted 
         list of strings"""
@@ -153,9 +278,14 @@ class Ranker:
         if not ranking_list:
             return ["There are no teams to rank"]
         else:
-            string_list: list[str] = [f"{team.rank}. {team.name}, {team.points} pts" for team in ranking_list]
+            string_list: list[str] = [self.getTeamRankingString(team) for team in ranking_list]
             return string_list
 
+    def getTeamRankingString(self, team: Team) -> str:
+        """Returns a team's row in the ranking table as a formatted string"""
+
+        return f"{team.rank}. {team.name}, {team.points} pts"
+
     def __str__(self) -> str:
         """Returns a string representation of this instance and the teams it
         contains."""
@@ -0,0 +1,147 @@
+"""ranking_cache.py module
+
+This module defines the RankingCache class that stores computed ranking 
+tables on disk, keyed by a fingerprint of the input files and the scoring
+configuration, so that repeated runs over unchanged input files can write 
+the ranking table without parsing any game results.
+
+"""
+
+import os
+import hashlib
+import tempfile
+from typing import Optional
+
+from .ranker import Ranker
+
+class RankingCache:
+    """Class to store and retrieve ranking tables in a size-bounded on-disk 
+    cache, evicting the least recently used tables first."""
+
+    # Class constants describing the cache layout
+    EntryExtension = ".table"
+    StatsFilename = "cache_stats.log"
+    HitRecord = b"h"
+    MissRecord = b"m"
+    FingerprintVersion = 1
+
+    def __init__(self, cache_dir: str, max_bytes: int) -> None:
+        """Initializes the cache in a directory, and loads the hit and miss
+        counters recorded by previous runs."""
+
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.loadStats()
+
+    def getFingerprint(self, input_files: list[str], ranker: Ranker) -> str:
+        """Computes a fingerprint from the path, size and modification time of
+        each input file, and the points awarded by the ranker."""
+
+        fingerprint = hashlib.sha256()
+        fingerprint.update(f"{self.FingerprintVersion}\n".encode("utf-8"))
+        fingerprint.update(f"{ranker.PointsForWin},{ranker.PointsForDraw},{ranker.PointsForLoss}\n".encode("utf-8"))
+
+        for input_file in input_files:
+            stat = os.stat(input_file)
+            fingerprint.update(f"{os.path.abspath(input_file)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+
+        return fingerprint.hexdigest()
+
+    def getEntryPath(self, fingerprint: str) -> str:
+        """Returns the path of the cache entry for a fingerprint."""
+
+        return os.path.join(self.cache_dir, fingerprint + self.EntryExtension)
+
+    def get(self, fingerprint: str) -> Optional[str]:
+        """Returns the cached ranking table for a fingerprint, or None if it 
+        is not cached. Updates the hit and miss counters."""
+
+        entry_path = self.getEntryPath(fingerprint)
+        try:
+            with open(entry_path, "r") as f:
+                table = f.read()
+            # Mark the entry as recently used
+            os.utime(entry_path)
+        except OSError:
+            table = None
+
+        self.recordLookup(table is not None)
+        self.loadStats()
+        return table
+
+    def put(self, fingerprint: str, table: str) -> None:
+        """Stores a ranking table for a fingerprint, then evicts the least 
+        recently used tables until the cache fits within its size limit."""
+
+        if len(table.encode("utf-8")) > self.max_bytes:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self.writeAtomically(self.getEntryPath(fingerprint), table)
+            self.evict()
+        except OSError:
+            pass
+
+    def evict(self) -> None:
+        """Removes the least recently used tables until the total size of the
+        cache is within max_bytes."""
+
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(self.EntryExtension):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+
+            try:
+                os.remove(path)
+                total_bytes -= size
+            except OSError:
+                pass
+
+    def recordLookup(self, hit: bool) -> None:
+        """Appends a hit or miss record to the statistics log in the cache 
+        directory. Each record is a single appended byte, so concurrent runs
+        never overwrite each other's records."""
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd = os.open(os.path.join(self.cache_dir, self.StatsFilename), 
+                         os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, self.HitRecord if hit else self.MissRecord)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+    def loadStats(self) -> None:
+        """Sets the hit and miss counters from the records of all runs in the
+        statistics log."""
+
+        try:
+            with open(os.path.join(self.cache_dir, self.StatsFilename), "rb") as f:
+                records = f.read()
+        except OSError:
+            records = b""
+
+        self.hits = records.count(self.HitRecord)
+        self.misses = records.count(self.MissRecord)
+
+    def writeAtomically(self, filename: str, contents: str) -> None:
+        """Writes a file via a temporary file, so concurrent runs never read a
+        partially written file."""
+
+        fd, temp_filename = tempfile.mkstemp(dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(contents)
+            os.replace(temp_filename, filename)
+        except OSError:
+            os.remove(temp_filename)
+            raise
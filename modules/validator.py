@@ -0,0 +1,163 @@
+"""validator.py module
+
+This module validates game results in an input file without computing a 
+ranking table, reporting every invalid line rather than stopping at the 
+first one. Plain text files are split into fixed-size chunks at line 
+boundaries and the chunks are validated by worker processes. Compressed 
+files are decompressed once, and batches of lines are validated by worker 
+processes.
+
+"""
+
+import os
+import mmap
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterator, Optional
+
+from .ranker import Ranker
+from .file_reader import isCompressedFile, readInputFile, splitGameResultsText, InputEncoding
+from .compiled_format import isCompiledFile
+
+# Size of the chunks a plain text file is split into, so that the memory 
+# used by each worker process does not grow with the size of the file
+ChunkBytes = 16 << 20
+
+# Smallest compressed file, and number of lines per batch, worth sending to
+# worker processes
+MinimumCompressedBytes = 1 << 20
+BatchLines = 50000
+
+
+def validateGameResultsLines(lines: list[str], first_line_number: int) -> list[tuple[int, str]]:
+    """Validates each line of game results, and returns the line number and
+    error message of every invalid line."""
+
+    parser = Ranker()
+    errors = []
+    for line_number, game_results in enumerate(lines, start=first_line_number):
+        try:
+            parser.parseGameResultsString(game_results)
+        except ValueError as VErr:
+            errors.append((line_number, str(VErr)))
+
+    return errors
+
+
+def validateFileChunk(filename: str, start: int, end: int) -> tuple[int, list[tuple[int, str]]]:
+    """Validates the lines of game results between two byte offsets of a 
+    plain text file. Returns the number of lines in the chunk, and the line 
+    number relative to the start of the chunk and error message of every 
+    invalid line."""
+
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            chunk = mm[start:end]
+
+    lines = splitGameResultsText(chunk.decode(InputEncoding))
+
+    return len(lines), validateGameResultsLines(lines, 1)
+
+
+def getFileChunks(filename: str) -> Iterator[tuple[int, int]]:
+    """Yields the byte ranges of a plain text file split into chunks of about
+    ChunkBytes, each starting at the beginning of a line."""
+
+    file_size = os.path.getsize(filename)
+    if file_size == 0:
+        return
+
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < file_size:
+                newline = mm.find(b"\n", start + ChunkBytes - 1)
+                end = file_size if newline == -1 else newline + 1
+                yield start, end
+                start = end
+
+
+def checkPlainFile(filename: str, executor: Optional[ProcessPoolExecutor], 
+                   max_pending: int = 1) -> tuple[int, list[tuple[int, str]]]:
+    """Validates a plain text file in chunks, returning the number of lines
+    checked and the line number and error message of every invalid line. At
+    most max_pending chunks are submitted to the executor at a time, so 
+    memory does not grow with the size of the file."""
+
+    futures, results = deque(), []
+
+    for start, end in getFileChunks(filename):
+        if executor is None:
+            results.append(validateFileChunk(filename, start, end))
+        else:
+            # Collect the oldest chunk's errors before submitting another
+            if len(futures) >= max_pending:
+                results.append(futures.popleft().result())
+            futures.append(executor.submit(validateFileChunk, filename, start, end))
+
+    while futures:
+        results.append(futures.popleft().result())
+
+    line_count, errors = 0, []
+    for chunk_line_count, chunk_errors in results:
+        errors.extend((line_count + line_number, message) for line_number, message in chunk_errors)
+        line_count += chunk_line_count
+
+    return line_count, errors
+
+
+def checkCompressedFile(filename: str, executor: Optional[ProcessPoolExecutor],
+                        max_pending: int = 1) -> tuple[int, list[tuple[int, str]]]:
+    """Validates a compressed file in batches of lines, returning the number
+    of lines checked and the line number and error message of every invalid
+    line. At most max_pending batches are submitted to the executor at a 
+    time, so memory does not grow with the size of the file."""
+
+    lines = readInputFile(filename)
+    futures, line_count, errors = deque(), 0, []
+
+    while batch := list(islice(lines, BatchLines)):
+        if executor is None:
+            errors.extend(validateGameResultsLines(batch, line_count + 1))
+        else:
+            # Collect the oldest batch's errors before submitting another
+            if len(futures) >= max_pending:
+                errors.extend(futures.popleft().result())
+            futures.append(executor.submit(validateGameResultsLines, batch, line_count + 1))
+        line_count += len(batch)
+
+    while futures:
+        errors.extend(futures.popleft().result())
+
+    return line_count, errors
+
+
+def checkInputFile(filename: str, worker_count: Optional[int] = None) -> tuple[int, list[tuple[int, str]]]:
+    """Validates every line of game results in an input file using worker
+    processes, with the same rules as Ranker.processGameResultsString. 
+    Returns the number of lines checked and the line number and error message
+    of every invalid line."""
+
+    if isCompiledFile(filename):
+        raise Exception(f"Compiled file '{filename}' was validated when it was compiled.")
+
+    worker_count = worker_count or os.cpu_count() or 1
+    compressed = isCompressedFile(filename)
+
+    # Worker processes are only started when there is enough input to share
+    file_size = os.path.getsize(filename)
+    if worker_count < 2 or (not compressed and file_size <= ChunkBytes) \
+            or (compressed and file_size < MinimumCompressedBytes):
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=worker_count)
+
+    try:
+        if compressed:
+            return checkCompressedFile(filename, executor, worker_count)
+        else:
+            return checkPlainFile(filename, executor, worker_count)
+    finally:
+        if executor is not None:
+            executor.shutdown()
@@ -0,0 +1,147 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+from io import StringIO
+
+from modules.approximate_ranker import ApproximateRanker
+from modules.ranker import Ranker
+from modules.compiled_format import compileResultsFile, loadCompiledFile
+import modules.cmd_utils as utils
+import league_ranker as lr
+
+class TestApproximateRanker(unittest.TestCase):
+
+    def setUp(self):
+        self.test_input_file = os.path.join("test", "test_data.txt")
+        self.ranker = ApproximateRanker(3)
+
+    def test_instance_of_approximate_ranker(self):
+        self.assertIsInstance(self.ranker, Ranker, 
+            "ApproximateRanker is not a Ranker")
+
+        with self.assertRaises(ValueError):
+            ApproximateRanker(0)
+
+        with self.assertRaises(ValueError):
+            ApproximateRanker(5, 4)
+
+    def test_exact_within_capacity(self):
+        exact_ranker = Ranker()
+        approximate_ranker = ApproximateRanker(5)
+        lr.processInputFile(self.test_input_file, exact_ranker)
+        lr.processInputFile(self.test_input_file, approximate_ranker)
+
+        self.assertEqual(approximate_ranker.getRankingListStrings(), 
+            exact_ranker.getRankingListStrings(), 
+            "ApproximateRanker differs from Ranker when all teams fit")
+
+        for team in approximate_ranker.teams:
+            self.assertEqual(approximate_ranker.getErrorBound(team.name), 0, 
+                "ApproximateRanker reported an error bound when all teams fit")
+
+    def test_addTeamPoints(self):
+        self.ranker.addTeamPoints("Arms", 10)
+        self.ranker.addTeamPoints("Legs", 8)
+        self.ranker.addTeamPoints("Chest", 5)
+        self.ranker.addTeamPoints("Head", 0)
+        self.assertNotIn("Head", [team.name for team in self.ranker.teams], 
+            "addTeamPoints replaced a team with a result earning no points")
+
+        self.ranker.addTeamPoints("Torso", 1)
+        self.assertEqual(len(self.ranker.teams), 3, 
+            "addTeamPoints kept more teams than the capacity")
+        self.assertEqual(self.ranker.getTeam("Torso").points, 6, 
+            "addTeamPoints failed to carry over the replaced team's points")
+        self.assertEqual(self.ranker.getErrorBound("Torso"), 5, 
+            "addTeamPoints recorded an incorrect error bound")
+        self.assertIsNone(self.ranker.getErrorBound("Chest"), 
+            "addTeamPoints failed to replace the team with the fewest points")
+
+        self.assertEqual(self.ranker.getRankingListStrings(), 
+            ["1. Arms, 10 pts", "2. Legs, 8 pts", "3. Torso, 6 pts (uncertain)"])
+        self.assertEqual(self.ranker.getErrorBoundStrings(), 
+            ["1. Arms, 10-10 pts", "2. Legs, 8-8 pts", "3. Torso, 1-6 pts (uncertain)"])
+
+    def addStrongAndWeakGames(self, *rankers):
+        """Few strong teams play against many teams that only appear once."""
+
+        random.seed(1)
+        strong_teams = [f"Strong {index}" for index in range(5)]
+        for index in range(2000):
+            team1_name = random.choice(strong_teams)
+            team2_name = f"Weak {index}"
+            team1_score, team2_score = random.randint(1, 5), random.randint(0, 2)
+            for ranker in rankers:
+                ranker.addGameResults(team1_name, team1_score, team2_name, team2_score)
+
+        return strong_teams
+
+    def test_error_bounds(self):
+        exact_ranker = Ranker()
+        approximate_ranker = ApproximateRanker(5, 20)
+        strong_teams = self.addStrongAndWeakGames(exact_ranker, approximate_ranker)
+
+        self.assertLessEqual(len(approximate_ranker.teams), 20)
+
+        exact_points = {team.name: team.points for team in exact_ranker.teams}
+        for team in approximate_ranker.teams:
+            error = approximate_ranker.getErrorBound(team.name)
+            self.assertGreaterEqual(team.points, exact_points[team.name], 
+                f"Points of team '{team.name}' are underestimated")
+            self.assertLessEqual(team.points - error, exact_points[team.name], 
+                f"Points of team '{team.name}' exceed the error bound")
+
+        guaranteed_points = approximate_ranker.getGuaranteedPoints()
+        for team_name, points in exact_points.items():
+            if points > guaranteed_points:
+                self.assertIsNotNone(approximate_ranker.getErrorBound(team_name), 
+                    f"Team '{team_name}' with {points} pts is not ranked")
+
+        top_names = [team.name for team in approximate_ranker.getRankingList()[:5]]
+        self.assertEqual(sorted(top_names), strong_teams, 
+            "ApproximateRanker failed to rank the top teams")
+
+        ranking_strings = approximate_ranker.getRankingListStrings()
+        self.assertEqual(len(ranking_strings), 5, 
+            "getRankingListStrings ranked more than the top teams")
+        self.assertFalse(any(string.endswith(ApproximateRanker.UncertainRowMarker) 
+                             for string in ranking_strings), 
+            "getRankingListStrings marked a guaranteed top team as uncertain")
+
+    def test_uncertain_rows(self):
+        exact_ranker = Ranker()
+        approximate_ranker = ApproximateRanker(5)
+        self.addStrongAndWeakGames(exact_ranker, approximate_ranker)
+
+        exact_top_names = [team.name for team in exact_ranker.getRankingList()[:5]]
+        ranking_strings = approximate_ranker.getRankingListStrings()
+        self.assertTrue(any(string.endswith(ApproximateRanker.UncertainRowMarker) 
+                            for string in ranking_strings), 
+            "getRankingListStrings marked no rows as uncertain with no spare teams")
+
+        for team, string in zip(approximate_ranker.getRankingList(), ranking_strings):
+            if not string.endswith(ApproximateRanker.UncertainRowMarker):
+                self.assertIn(team.name, exact_top_names, 
+                    f"Team '{team.name}' is not a top team, but was not marked as uncertain")
+
+    def test_compiled_input_rejected(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            compiled_file = os.path.join(temp_dir, "test_data.lrb")
+            compileResultsFile(self.test_input_file, compiled_file)
+
+            with self.assertRaises(ValueError):
+                loadCompiledFile(compiled_file, self.ranker)
+
+            mock_cmdline = StringIO()
+            with patch("sys.stdout", new=mock_cmdline), \
+                self.assertRaises(SystemExit):
+                utils.parseArguments(["-k", "3", compiled_file])
+
+            mock_cmdline.seek(0)
+            self.assertIn("Compiled files cannot be ranked approximately", 
+                mock_cmdline.read())
+
+if __name__ == "__main__":
+    unittest.main()
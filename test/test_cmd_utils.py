@@ -1,6 +1,7 @@
 import os
 import sys
 sys.path.append("..")
+import tempfile
 import unittest
 from unittest.mock import patch
 from io import StringIO
@@ -21,7 +22,10 @@ class TestUtils(unittest.TestCase):
 
     def test_config(self):
         keys = ("modes", "default_output_path", "default_output_filename",
-                "default_output_extension", "valid_file_extensions")
+                "default_output_extension", "valid_file_extensions",
+                "compiled_file_extension",
+                "cache_enabled", "cache_path", "cache_max_bytes",
+                "approximate_counters_per_team", "delta_file_suffix")
 
         config_keys = utils.config.keys()
         for key in keys:
@@ -45,6 +49,31 @@ class TestUtils(unittest.TestCase):
         except Exception:
             self.fail("validateInputFile raised an unexpected exception.")
 
+        with tempfile.TemporaryDirectory() as temp_dir:
+            compressed_file = os.path.join(temp_dir, "test_data.txt.gz")
+            open(compressed_file, "wb").close()
+            try:
+                utils.validateInputFile(compressed_file)
+            except Exception:
+                self.fail("validateInputFile rejected a compressed input file.")
+
+            compressed_file = os.path.join(temp_dir, "test_data.txt.GZ")
+            open(compressed_file, "wb").close()
+            try:
+                utils.validateInputFile(compressed_file)
+            except Exception:
+                self.fail("validateInputFile rejected an upper case compressed extension.")
+
+            compressed_file = os.path.join(temp_dir, "test_data.lrb.gz")
+            open(compressed_file, "wb").close()
+            with self.assertRaises(Exception) as err:
+                utils.validateInputFile(compressed_file)
+
+            compressed_file = os.path.join(temp_dir, "test_data.ext.gz")
+            open(compressed_file, "wb").close()
+            with self.assertRaises(Exception) as err:
+                utils.validateInputFile(compressed_file)
+
     def test_validateOutputFile(self):
         self.assertEqual(utils.validateOutputFile(None), 
             self.default_output_file)
@@ -60,6 +89,12 @@ class TestUtils(unittest.TestCase):
             patch("sys.stdout", new=StringIO()):
             
             self.assertEqual(utils.validateOutputFile(i_string), r_string)
+
+    def test_validateCompiledFile(self):
+        for input_file in ("results.txt", "results.txt.gz", "results.txt.XZ"):
+            self.assertEqual(utils.validateCompiledFile(None, os.path.join("test", input_file)), 
+                os.path.join("test", "results" + utils.config["compiled_file_extension"]),
+                f"validateCompiledFile derived the wrong compiled file from '{input_file}'")
         
     def test_parseArguments(self):
         self.assertEqual(utils.parseArguments([]), 
@@ -102,6 +137,35 @@ class TestUtils(unittest.TestCase):
                 "Input_file": self.test_input_file, 
                 "Output_file": self.default_output_file})
 
+        with patch("builtins.input", return_value="n"), \
+            patch("sys.stdout", new=StringIO()):
+            
+            self.assertEqual(utils.parseArguments(["compile", self.test_input_file]), 
+                {"Mode": utils.Modes.COMPILE, 
+                "Input_file": self.test_input_file, 
+                "Output_file": os.path.join("test", "test_data.lrb")})
+
+            self.assertEqual(utils.parseArguments(["-d", self.test_input_file, self.fake_output_file]), 
+                {"Mode": utils.Modes.FILE_IO, 
+                "Input_file": self.test_input_file, 
+                "Output_file": self.fake_output_file,
+                "Delta_file": os.path.join("test", "somefile_delta.txt")})
+
+            self.assertEqual(utils.parseArguments(["-k", "10", self.test_input_file, self.fake_output_file]), 
+                {"Mode": utils.Modes.FILE_IO, 
+                "Input_file": self.test_input_file, 
+                "Output_file": self.fake_output_file,
+                "Top_k": 10})
+
+            self.assertEqual(utils.parseArguments(["--check", self.test_input_file]), 
+                {"Mode": utils.Modes.CHECK, 
+                "Input_file": self.test_input_file})
+
+            self.assertEqual(utils.parseArguments(["compile", self.test_input_file, self.fake_output_file]), 
+                {"Mode": utils.Modes.COMPILE, 
+                "Input_file": self.test_input_file, 
+                "Output_file": os.path.join("test", "somefile.lrb")})
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,110 @@
+import os
+import gzip
+import tempfile
+import unittest
+
+import modules.compiled_format as compiled
+from modules.ranker import Ranker
+import league_ranker as lr
+
+class TestCompiledFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.test_input_file = os.path.join("test", "test_data.txt")
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.compiled_file = os.path.join(self.temp_dir.name, "test_data.lrb")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_compileResultsFile(self):
+        self.assertEqual(compiled.compileResultsFile(self.test_input_file, 
+            self.compiled_file), (5, 5), 
+            "compileResultsFile returned incorrect team and game result counts")
+
+        self.assertTrue(compiled.isCompiledFile(self.compiled_file), 
+            "compileResultsFile did not write a compiled file")
+
+        self.assertFalse(compiled.isCompiledFile(self.test_input_file), 
+            "isCompiledFile detected a text file as compiled")
+
+    def test_compileResultsFile_invalid(self):
+        invalid_file = os.path.join(self.temp_dir.name, "invalid.txt")
+        with open(invalid_file, "w") as f:
+            f.write("Lions 3 Snakes 3\n")
+
+        with self.assertRaises(ValueError):
+            compiled.compileResultsFile(invalid_file, self.compiled_file)
+
+    def test_loadCompiledFile(self):
+        compiled.compileResultsFile(self.test_input_file, self.compiled_file)
+        compiled_ranker = Ranker()
+        compiled.loadCompiledFile(self.compiled_file, compiled_ranker)
+
+        text_ranker = Ranker()
+        lr.processInputFile(self.test_input_file, text_ranker)
+
+        self.assertEqual(compiled_ranker.getRankingListStrings(), 
+            text_ranker.getRankingListStrings(), 
+            "loadCompiledFile produced a different ranking table to the text input file")
+
+    def test_loadCompiledFile_empty(self):
+        empty_file = os.path.join(self.temp_dir.name, "empty.txt")
+        open(empty_file, "w").close()
+        self.assertEqual(compiled.compileResultsFile(empty_file, 
+            self.compiled_file), (0, 0))
+
+        ranker = Ranker()
+        compiled.loadCompiledFile(self.compiled_file, ranker)
+        self.assertEqual(ranker.teams, [], 
+            "loadCompiledFile added teams from an empty compiled file")
+
+    def test_loadCompiledFile_invalid(self):
+        compiled.compileResultsFile(self.test_input_file, self.compiled_file)
+        with open(self.compiled_file, "rb") as f:
+            data = f.read()
+
+        with open(self.compiled_file, "wb") as f:
+            f.write(data[:-1])
+
+        with self.assertRaises(ValueError):
+            compiled.loadCompiledFile(self.compiled_file, Ranker())
+
+    def test_processTextFileWithMagicNumber(self):
+        text_file = os.path.join(self.temp_dir.name, "in.txt")
+        with open(text_file, "w") as f:
+            f.write("LRNKers 3, Owls 1\n")
+
+        self.assertFalse(compiled.isCompiledFile(text_file), 
+            "isCompiledFile detected a text file starting with the magic number as compiled")
+
+        ranker = Ranker()
+        lr.processInputFile(text_file, ranker)
+        self.assertEqual(ranker.getRankingListStrings(), 
+            ["1. LRNKers, 3 pts", "2. Owls, 0 pts"], 
+            "processInputFile processed a text file starting with the magic number incorrectly")
+
+    def test_loadCompiledFile_not_compiled(self):
+        with open(self.compiled_file, "w") as f:
+            f.write("Lions 3, Snakes 3\n" * 4)
+
+        with self.assertRaises(ValueError) as err:
+            compiled.loadCompiledFile(self.compiled_file, Ranker())
+        self.assertIn("is not a compiled game results file", str(err.exception))
+
+    def test_processCompiledInputFile(self):
+        compressed_file = os.path.join(self.temp_dir.name, "test_data.txt.gz")
+        with open(self.test_input_file, "rb") as f_in, \
+            gzip.open(compressed_file, "wb") as f_out:
+            f_out.write(f_in.read())
+
+        compiled.compileResultsFile(compressed_file, self.compiled_file)
+        ranker = Ranker()
+        lr.processInputFile(self.compiled_file, ranker)
+
+        self.assertEqual(ranker.getRankingListStrings()[0], 
+            "1. Tarantulas, 6 pts", 
+            "processInputFile processed a compiled input file incorrectly")
+
+if __name__ == "__main__":
+    unittest.main()
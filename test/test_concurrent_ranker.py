@@ -0,0 +1,125 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from modules.concurrent_ranker import ConcurrentRanker
+from modules.ranker import Ranker
+
+class TestConcurrentRanker(unittest.TestCase):
+
+    def setUp(self):
+        self.ranker = ConcurrentRanker()
+
+    def test_instance_of_concurrent_ranker(self):
+        self.assertIsInstance(self.ranker, Ranker, 
+            "ConcurrentRanker is not a Ranker")
+
+    def test_getTeam(self):
+        self.ranker.addTeamPoints("Test Team 1", 5)
+        self.ranker.addTeamPoints("Test Team 1", 2)
+
+        team = self.ranker.getTeam("Test Team 1")
+        self.assertEqual(team.points, 7, 
+            "getTeam failed to merge accumulated points")
+        self.assertIs(self.ranker.getTeam("Test Team 1"), team, 
+            "getTeam not finding team in teams collection")
+
+    def test_processGameResultsString(self):
+        self.ranker.processGameResultsString("Lions 3, Snakes 1")
+        self.assertEqual(self.ranker.getRankingListStrings(), 
+            ["1. Lions, 3 pts", "2. Snakes, 0 pts"], 
+            "processGameResultsString added points incorrectly")
+
+    def test_exited_thread_accumulators_removed(self):
+        for _ in range(3):
+            threads = [threading.Thread(target=self.ranker.addTeamPoints, args=("Test Team 1", 1)) 
+                       for _ in range(20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.ranker.getRankingList()
+            self.assertEqual(self.ranker.accumulators, [], 
+                "mergeAccumulators kept accumulators of exited threads")
+
+        self.assertEqual(self.ranker.getTeam("Test Team 1").points, 60, 
+            "mergeAccumulators lost points of exited threads")
+
+    def test_concurrent_ingestion(self):
+        thread_count, game_count = 8, 2000
+        team_names = [f"Team {index}" for index in range(10)]
+        start = threading.Barrier(thread_count + 1)
+        errors = []
+
+        def addResults(thread_index):
+            try:
+                start.wait()
+                for index in range(game_count):
+                    team1_name = team_names[(thread_index + index) % len(team_names)]
+                    team2_name = team_names[(thread_index + index + 1) % len(team_names)]
+                    self.ranker.processGameResultsString(f"{team1_name} 2, {team2_name} 1")
+            except Exception as Err:
+                errors.append(Err)
+
+        def readRankings():
+            start.wait()
+            while any(thread.is_alive() for thread in threads):
+                self.ranker.getRankingList()
+
+        threads = [threading.Thread(target=addResults, args=(index,)) 
+                   for index in range(thread_count)]
+        reader = threading.Thread(target=readRankings)
+        for thread in threads:
+            thread.start()
+        reader.start()
+
+        for thread in threads:
+            thread.join()
+        reader.join()
+
+        self.assertEqual(errors, [])
+
+        ranking_list = self.ranker.getRankingList()
+        self.assertEqual(len(ranking_list), len(team_names), 
+            "Concurrent ingestion created duplicate or missing teams")
+
+        total_points = sum(team.points for team in ranking_list)
+        self.assertEqual(total_points, 
+            thread_count * game_count * self.ranker.PointsForWin, 
+            "Concurrent ingestion lost points")
+
+        # Every team wins the same number of games across all threads
+        for team in ranking_list:
+            self.assertEqual(team.points, 
+                thread_count * game_count // len(team_names) * self.ranker.PointsForWin, 
+                f"Concurrent ingestion added points incorrectly for team '{team.name}'")
+
+    def test_concurrent_emitRankingDelta(self):
+        self.ranker.addTeamPoints("Arms", 10)
+        reader_threads = []
+        getTeamRankingString = self.ranker.getTeamRankingString
+
+        def addResultsWhileEmitting(team):
+            # Another thread adds and merges points while the delta is being
+            # formatted, and must wait until the delta is recorded as emitted
+            if not reader_threads:
+                def addAndReadRankings():
+                    self.ranker.addTeamPoints("Legs", 8)
+                    self.ranker.getRankingList()
+
+                reader_threads.append(threading.Thread(target=addAndReadRankings))
+                reader_threads[0].start()
+                reader_threads[0].join(timeout=0.2)
+
+            return getTeamRankingString(team)
+
+        with patch.object(self.ranker, "getTeamRankingString", side_effect=addResultsWhileEmitting):
+            self.assertEqual(self.ranker.emitRankingDelta(), ["1. Arms, 10 pts"])
+        reader_threads[0].join()
+
+        self.assertEqual(self.ranker.emitRankingDelta(), ["2. Legs, 8 pts"], 
+            "emitRankingDelta lost rows changed while emitting a delta")
+
+if __name__ == "__main__":
+    unittest.main()
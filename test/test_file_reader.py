@@ -0,0 +1,88 @@
+import os
+import bz2
+import gzip
+import lzma
+import tempfile
+import unittest
+
+import modules.file_reader as reader
+from modules.ranker import Ranker
+import league_ranker as lr
+
+class TestFileReader(unittest.TestCase):
+
+    def setUp(self):
+        self.test_input_file = os.path.join("test", "test_data.txt")
+        with open(self.test_input_file, "r") as f:
+            self.test_lines = f.readlines()
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def writeCompressedFile(self, opener, ext):
+        filename = os.path.join(self.temp_dir.name, "test_data.txt" + ext)
+        with opener(filename, "wt") as f:
+            f.writelines(self.test_lines)
+
+        return filename
+
+    def test_isCompressedFile(self):
+        for ext in (".gz", ".bz2", ".xz", ".GZ"):
+            self.assertTrue(reader.isCompressedFile("results.txt" + ext), 
+                f"isCompressedFile failed to detect extension '{ext}'")
+
+        self.assertFalse(reader.isCompressedFile(self.test_input_file), 
+            "isCompressedFile detected a plain text file as compressed")
+
+    def test_readPlainFile(self):
+        self.assertEqual(list(reader.readPlainFile(self.test_input_file)), 
+            self.test_lines, "readPlainFile read lines incorrectly")
+
+        empty_file = os.path.join(self.temp_dir.name, "empty.txt")
+        open(empty_file, "w").close()
+        self.assertEqual(list(reader.readPlainFile(empty_file)), [], 
+            "readPlainFile failed to read an empty file")
+
+    def test_readPlainFile_newlines(self):
+        newlines_file = os.path.join(self.temp_dir.name, "newlines.txt")
+        with open(newlines_file, "wb") as f:
+            f.write(b"Lions 3, Snakes 3\r\nTarantulas 1, FC Awesome 0\rLions 1, FC Awesome 1")
+
+        expected_lines = ["Lions 3, Snakes 3\n", "Tarantulas 1, FC Awesome 0\n", 
+            "Lions 1, FC Awesome 1"]
+        self.assertEqual(list(reader.readPlainFile(newlines_file)), 
+            expected_lines, "readPlainFile failed to translate line endings")
+        self.assertEqual(reader.readInputText(newlines_file), 
+            "".join(expected_lines), "readInputText failed to translate line endings")
+
+    def test_splitGameResultsText(self):
+        self.assertEqual(reader.splitGameResultsText("Lions 3, Snakes 3\nLions 1, FC Awesome 1\n"), 
+            ["Lions 3, Snakes 3", "Lions 1, FC Awesome 1"], 
+            "splitGameResultsText failed to split lines ending with a newline")
+        self.assertEqual(reader.splitGameResultsText("Lions 3, Snakes 3\n\nLions 1, FC Awesome 1"), 
+            ["Lions 3, Snakes 3", "", "Lions 1, FC Awesome 1"], 
+            "splitGameResultsText failed to keep an empty line")
+        self.assertEqual(reader.splitGameResultsText(""), [], 
+            "splitGameResultsText failed to split an empty string")
+
+    def test_readCompressedFile(self):
+        for opener, ext in ((gzip.open, ".gz"), (bz2.open, ".bz2"), 
+                            (lzma.open, ".xz")):
+            filename = self.writeCompressedFile(opener, ext)
+            self.assertEqual(list(reader.readInputFile(filename)), 
+                self.test_lines, 
+                f"readInputFile read '{ext}' compressed file incorrectly")
+
+    def test_processCompressedInputFile(self):
+        filename = self.writeCompressedFile(gzip.open, ".gz")
+        ranker = Ranker()
+        lr.processInputFile(filename, ranker)
+
+        self.assertEqual(ranker.getRankingListStrings()[0], 
+            "1. Tarantulas, 6 pts", 
+            "processInputFile processed a compressed input file incorrectly")
+
+if __name__ == "__main__":
+    unittest.main()
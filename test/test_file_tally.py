@@ -0,0 +1,197 @@
+import os
+import gzip
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+from io import StringIO
+
+import modules.file_tally as tally
+import modules.cmd_utils as utils
+from modules.compiled_format import compileResultsFile
+from modules.ranker import Ranker
+import league_ranker as lr
+
+class TestFileTally(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        random.seed(1)
+        team_names = [f"Team {index}" for index in range(12)]
+        self.input_files = []
+        self.all_lines = []
+        self.matchday_lines = []
+        for index in range(8):
+            lines = []
+            for _ in range(25):
+                team1_name, team2_name = random.sample(team_names, 2)
+                lines.append(f"{team1_name} {random.randint(0, 4)}, {team2_name} {random.randint(0, 4)}\n")
+            self.all_lines.extend(lines)
+            self.matchday_lines.append(lines)
+
+            input_file = os.path.join(self.temp_dir.name, f"matchday_{index}.txt")
+            with open(input_file, "w") as f:
+                f.writelines(lines)
+            self.input_files.append(input_file)
+
+        # Store one matchday compressed, and another compiled
+        with open(self.input_files[2], "rb") as f_in, \
+            gzip.open(self.input_files[2] + ".gz", "wb") as f_out:
+            f_out.write(f_in.read())
+        os.remove(self.input_files[2])
+        self.input_files[2] += ".gz"
+
+        compiled_file = os.path.join(self.temp_dir.name, "matchday_5.lrb")
+        compileResultsFile(self.input_files[5], compiled_file)
+        os.remove(self.input_files[5])
+        self.input_files[5] = compiled_file
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_tallyGameResultsText(self):
+        self.assertEqual(tally.tallyGameResultsText("Lions 3, Snakes 3\nLions 1, Grouches 0\n"), 
+            {"Lions": 4, "Snakes": 1, "Grouches": 0}, 
+            "tallyGameResultsText tallied points incorrectly")
+
+        with self.assertRaises(ValueError):
+            tally.tallyGameResultsText("Lions 3, Snakes 3\nLions 1 Grouches 0")
+
+    def test_processInputFiles(self):
+        concatenated_ranker = Ranker()
+        for game_results in self.all_lines:
+            concatenated_ranker.processGameResultsString(game_results)
+
+        ranker = Ranker()
+        lr.processInputFiles(self.input_files, ranker)
+
+        self.assertEqual(ranker.getRankingListStrings(), 
+            concatenated_ranker.getRankingListStrings(), 
+            "processInputFiles differs from processing the concatenated files")
+        self.assertEqual([team.name for team in ranker.teams], 
+            [team.name for team in concatenated_ranker.teams], 
+            "processInputFiles added teams in a different order")
+
+    def test_processInputFiles_approximate(self):
+        # Directories do not input compiled files or sub directories
+        concatenated_dir = os.path.join(self.temp_dir.name, "concatenated")
+        os.mkdir(concatenated_dir)
+        concatenated_file = os.path.join(concatenated_dir, "concatenated.txt")
+        with open(concatenated_file, "w") as f:
+            for index, lines in enumerate(self.matchday_lines):
+                if not self.input_files[index].endswith(".lrb"):
+                    f.writelines(lines)
+
+        output_file = os.path.join(concatenated_dir, "output.txt")
+        concatenated_output_file = os.path.join(concatenated_dir, "concatenated_output.txt")
+        with patch.dict(utils.config, {"cache_enabled": False}), \
+            patch("builtins.input", return_value="n"):
+
+            directory_output = StringIO()
+            with patch("sys.stdout", new=directory_output):
+                lr.main(["-k", "3", self.temp_dir.name, output_file])
+
+            concatenated_output = StringIO()
+            with patch("sys.stdout", new=concatenated_output):
+                lr.main(["-k", "3", concatenated_file, concatenated_output_file])
+
+        with open(output_file, "r") as f, open(concatenated_output_file, "r") as f_concatenated:
+            self.assertEqual(f.read(), f_concatenated.read(), 
+                "-k over multiple files differs from -k over the concatenated file")
+
+        self.assertEqual(directory_output.getvalue(), concatenated_output.getvalue(), 
+            "-k over multiple files reported different error bounds")
+
+    def test_processInputFiles_invalid(self):
+        with open(self.input_files[3], "a") as f:
+            f.write("Lions 1 Grouches 0\n")
+
+        mock_cmdline = StringIO()
+        with patch("sys.stdout", new=mock_cmdline), \
+            self.assertRaises(SystemExit):
+            lr.processInputFiles(self.input_files, Ranker())
+
+        mock_cmdline.seek(0)
+        self.assertIn(f"Input file '{self.input_files[3]}'", mock_cmdline.read(), 
+            "processInputFiles failed to report the invalid input file")
+
+    def test_validateInputPaths(self):
+        results_files = sorted(filename for filename in self.input_files if not filename.endswith(".lrb"))
+        self.assertEqual(utils.validateInputPaths([self.temp_dir.name]), 
+            results_files, "validateInputPaths failed to resolve a directory")
+
+        pattern = os.path.join(self.temp_dir.name, "*.txt")
+        text_files = sorted(filename for filename in self.input_files if filename.endswith(".txt"))
+        self.assertEqual(utils.validateInputPaths([pattern, self.input_files[0]]), 
+            text_files, "validateInputPaths failed to resolve a glob pattern")
+
+        with self.assertRaises(Exception):
+            utils.validateInputPaths([os.path.join(self.temp_dir.name, "*.md")])
+
+    def test_validateInputPaths_compiled_copy(self):
+        # Compile a matchday next to its text file, as compile does by default
+        compiled_file = os.path.join(self.temp_dir.name, "matchday_0.lrb")
+        compileResultsFile(self.input_files[0], compiled_file)
+
+        input_files = utils.validateInputPaths([self.temp_dir.name])
+        self.assertNotIn(compiled_file, input_files, 
+            "validateInputPaths input a compiled file from a directory")
+
+        concatenated_ranker = Ranker()
+        for game_results in self.all_lines[:75]:
+            concatenated_ranker.processGameResultsString(game_results)
+        ranker = Ranker()
+        lr.processInputFiles(utils.validateInputPaths([self.temp_dir.name])[:3], ranker)
+        self.assertEqual(ranker.getRankingListStrings(), 
+            concatenated_ranker.getRankingListStrings(), 
+            "Game results in a directory were counted more than once")
+
+        with self.assertRaises(Exception):
+            utils.validateInputPaths([os.path.join(self.temp_dir.name, "matchday_0.*")])
+
+        with self.assertRaises(Exception):
+            utils.validateInputPaths([self.temp_dir.name, compiled_file])
+
+    def test_validateInputPaths_output_file(self):
+        output_file = os.path.join(self.temp_dir.name, "output.txt")
+        with open(output_file, "w") as f:
+            f.write("1. Team 1, 3 pts")
+
+        self.assertNotIn(output_file, 
+            utils.validateInputPaths([self.temp_dir.name], [output_file]), 
+            "validateInputPaths input the output file from a directory")
+
+    def test_parseArguments(self):
+        output_file = os.path.join(self.temp_dir.name, "output.txt")
+        with patch("builtins.input", return_value="n"), \
+            patch("sys.stdout", new=StringIO()):
+
+            self.assertEqual(utils.parseArguments(["-m", output_file] + self.input_files[:2]), 
+                {"Mode": utils.Modes.FILE_IO, 
+                "Input_files": self.input_files[:2], 
+                "Output_file": output_file})
+
+            self.assertEqual(utils.parseArguments([self.temp_dir.name, output_file]), 
+                {"Mode": utils.Modes.FILE_IO, 
+                "Input_files": sorted(filename for filename in self.input_files if not filename.endswith(".lrb")), 
+                "Output_file": output_file})
+
+    def test_parseArguments_output_files(self):
+        # Output and delta files written by earlier runs are never input
+        output_file = os.path.join(self.temp_dir.name, "output.txt")
+        for filename in (output_file, utils.getDeltaFile(output_file)):
+            with open(filename, "w") as f:
+                f.write("1. Team 1, 3 pts")
+
+        input_files = sorted(filename for filename in self.input_files if not filename.endswith(".lrb"))
+        with patch("builtins.input", return_value="n"), \
+            patch("sys.stdout", new=StringIO()):
+
+            for args in (["-m", output_file, self.temp_dir.name], [self.temp_dir.name, output_file], 
+                         ["-d", self.temp_dir.name, output_file]):
+                self.assertEqual(utils.parseArguments(args)["Input_files"], input_files, 
+                    f"parseArguments input an output file from a directory with {args[0]}")
+
+if __name__ == "__main__":
+    unittest.main()
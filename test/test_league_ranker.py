@@ -1,5 +1,6 @@
 from cgi import test
 import os
+import tempfile
 import unittest
 from unittest.mock import patch, mock_open
 from io import StringIO
@@ -49,6 +50,24 @@ class TestUtils(unittest.TestCase):
         mocked_open.assert_called_once_with("test_output.txt", "w")
         mocked_open.return_value.writelines.assert_called_once_with(test_str)
 
+    def test_outputDeltaToFile(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, "output.txt")
+            delta_file = os.path.join(temp_dir, "output_delta.txt")
+            with open(output_file, "w") as f:
+                f.write("1. Tarantulas, 6 pts\n2. Lions, 4 pts\n3. Snakes, 1 pts")
+
+            lr.processInputFile(self.test_input_file, self.ranker)
+            lr.outputDeltaToFile(self.ranker, output_file, delta_file)
+
+            with open(delta_file, "r") as f:
+                self.assertEqual(f.read(), "2. Lions, 5 pts\n3. FC Awesome, 1 pts\n5. Grouches, 0 pts", 
+                    "outputDeltaToFile output incorrect changed rows")
+
+            with open(output_file, "r") as f:
+                self.assertEqual(f.read(), "\n".join(self.ranker.getRankingListStrings()),
+                    "outputDeltaToFile output an incorrect ranking table")
+
     def test_outputToCommandline(self):
         self.ranker.addTeamPoints("Test_team", 5)
 
@@ -1,4 +1,6 @@
+import random
 import unittest
+from unittest.mock import patch
 import sys
 sys.path.append("..")
 
@@ -136,6 +138,12 @@ class TestRanker(unittest.TestCase):
             self.assertEqual(result[0].rank, result[1], 
                 "getRankingList failed to compute correct rank value.")
 
+    def test_getRankingDelta_new_team(self):
+        ranker = Ranker()
+        ranker.getTeam("X")
+        self.assertEqual([ranker.getTeamRankingString(team) for team in ranker.getRankingDelta()],
+            ["1. X, 0 pts"], "getRankingDelta omitted a team created by getTeam")
+
     def test_getRankingListStrings(self):
         self.ranker.teams.clear()
 
@@ -170,5 +178,78 @@ class TestRanker(unittest.TestCase):
         self.assertEqual(self.ranker.getRankingListStrings(),  results_list, 
             "getRankingListStrings formed ranking list string incorrectly.")
 
+    def test_getRankingDelta(self):
+        self.ranker.addTeamPoints("Arms", 10)
+        self.ranker.addTeamPoints("Legs", 8)
+        self.ranker.addTeamPoints("Chest", 5)
+
+        delta = self.ranker.getRankingDelta()
+        self.assertEqual([team.name for team in delta], 
+            ["Arms", "Legs", "Chest", "Test Team 1", "Test Team 2"],
+            "getRankingDelta failed to include new teams")
+
+        self.ranker.markEmitted(delta)
+        self.assertEqual(self.ranker.getRankingDelta(), [], 
+            "getRankingDelta returned rows that have not changed")
+
+        # Chest overtakes Legs, and a new team Head takes the last rank
+        self.ranker.addTeamPoints("Chest", 4)
+        self.ranker.addTeamPoints("Head", 0)
+
+        delta_strings = [self.ranker.getTeamRankingString(team) 
+                         for team in self.ranker.getRankingDelta()]
+        self.assertEqual(delta_strings, 
+            ["2. Chest, 9 pts", "3. Legs, 8 pts", "4. Head, 0 pts"], 
+            "getRankingDelta returned incorrect changed rows")
+
+    def test_getRankingDelta_incremental(self):
+        random.seed(1)
+        team_names = [f"Team {index}" for index in range(30)]
+        emitted_strings = []
+
+        for _ in range(20):
+            for _ in range(random.randint(1, 5)):
+                team1_name, team2_name = random.sample(team_names, 2)
+                self.ranker.addGameResults(team1_name, random.randint(0, 3), 
+                                           team2_name, random.randint(0, 3))
+
+            with patch.object(Ranker, "getRankingList") as mocked_ranking_list:
+                delta = self.ranker.getRankingDelta()
+                mocked_ranking_list.assert_not_called()
+
+            delta_strings = [self.ranker.getTeamRankingString(team) for team in delta]
+            ranking_strings = self.ranker.getRankingListStrings()
+            expected_strings = [string for string in ranking_strings 
+                                if string not in emitted_strings]
+            self.assertEqual(delta_strings, expected_strings, 
+                "getRankingDelta differs from comparing the full ranking lists")
+
+            self.ranker.markEmitted(delta)
+            emitted_strings = ranking_strings
+
+    def test_emitRankingDelta(self):
+        self.ranker.addTeamPoints("Arms", 10)
+        self.assertEqual(self.ranker.emitRankingDelta(), 
+            ["1. Arms, 10 pts", "2. Test Team 1, 0 pts", "2. Test Team 2, 0 pts"], 
+            "emitRankingDelta returned incorrect changed rows")
+        self.assertEqual(self.ranker.emitRankingDelta(), [], 
+            "emitRankingDelta failed to record the rows as emitted")
+
+    def test_loadEmittedTable(self):
+        self.ranker.addTeamPoints("Arms", 10)
+        self.ranker.addTeamPoints("Legs", 8)
+
+        self.ranker.loadEmittedTable(["1. Arms, 10 pts\n", "2. Legs, 5 pts", 
+                                      "There are no teams to rank"])
+        self.assertEqual(self.ranker.emitted_table, 
+            {"Arms": (1, 10), "Legs": (2, 5)}, 
+            "loadEmittedTable parsed a ranking table incorrectly")
+
+        delta_strings = [self.ranker.getTeamRankingString(team) 
+                         for team in self.ranker.getRankingDelta()]
+        self.assertEqual(delta_strings, 
+            ["2. Legs, 8 pts", "3. Test Team 1, 0 pts", "3. Test Team 2, 0 pts"], 
+            "getRankingDelta failed to compare with a loaded ranking table")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
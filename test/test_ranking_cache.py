@@ -0,0 +1,116 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from io import StringIO
+
+from modules.ranking_cache import RankingCache
+from modules.ranker import Ranker
+import modules.cmd_utils as utils
+import league_ranker as lr
+
+class TestRankingCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+        self.cache = RankingCache(self.cache_dir, 1024)
+
+        self.test_input_file = os.path.join(self.temp_dir.name, "test_data.txt")
+        shutil.copy(os.path.join("test", "test_data.txt"), self.test_input_file)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_getFingerprint(self):
+        ranker = Ranker()
+        fingerprint = self.cache.getFingerprint([self.test_input_file], ranker)
+        self.assertEqual(fingerprint, 
+            self.cache.getFingerprint([self.test_input_file], ranker), 
+            "getFingerprint is not deterministic")
+
+        ranker.PointsForWin = 2
+        self.assertNotEqual(fingerprint, 
+            self.cache.getFingerprint([self.test_input_file], ranker), 
+            "getFingerprint ignored the scoring configuration")
+
+        with open(self.test_input_file, "a") as f:
+            f.write("\nLions 1, Snakes 0")
+        self.assertNotEqual(fingerprint, 
+            self.cache.getFingerprint([self.test_input_file], Ranker()), 
+            "getFingerprint ignored a change to the input file")
+
+    def test_getAndPut(self):
+        self.assertIsNone(self.cache.get("a"), 
+            "get returned a table that was never cached")
+
+        self.cache.put("a", "1. Lions, 3 pts")
+        self.assertEqual(self.cache.get("a"), "1. Lions, 3 pts", 
+            "get failed to return a cached table")
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1), 
+            "get counted cache hits and misses incorrectly")
+
+        reopened_cache = RankingCache(self.cache_dir, 1024)
+        self.assertEqual((reopened_cache.hits, reopened_cache.misses), (1, 1),
+            "RankingCache failed to load counters recorded by a previous run")
+
+    def test_concurrent_counters(self):
+        other_cache = RankingCache(self.cache_dir, 1024)
+        self.cache.get("a")
+        other_cache.get("a")
+        self.cache.get("a")
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 3), 
+            "get lost cache misses counted by another run")
+        self.assertEqual((RankingCache(self.cache_dir, 1024).misses), 3, 
+            "RankingCache lost cache misses counted by concurrent runs")
+
+    def test_evict(self):
+        self.cache.put("a", "a" * 400)
+        self.cache.put("b", "b" * 400)
+
+        # Make 'b' the least recently used entry before 'c' is added
+        entry_path = self.cache.getEntryPath("b")
+        os.utime(entry_path, ns=(0, 0))
+        self.cache.put("c", "c" * 400)
+
+        self.assertIsNone(self.cache.get("b"), 
+            "evict failed to remove the least recently used table")
+        self.assertIsNotNone(self.cache.get("a"), 
+            "evict removed a recently used table")
+        self.assertIsNotNone(self.cache.get("c"), 
+            "evict removed the newest table")
+
+        self.cache.put("d", "d" * 2048)
+        self.assertIsNone(self.cache.get("d"), 
+            "put cached a table larger than the cache")
+
+    def test_main_uses_cache(self):
+        output_file = os.path.join(self.temp_dir.name, "output.txt")
+        args = [self.test_input_file, output_file]
+
+        with patch.dict(utils.config, {"cache_path": self.cache_dir}), \
+            patch("builtins.input", return_value="n"), \
+            patch("sys.stdout", new=StringIO()):
+
+            lr.main(args)
+            with open(output_file, "r") as f:
+                expected_table = f.read()
+            os.remove(output_file)
+
+            with patch("league_ranker.processInputFile") as mocked_process:
+                lr.main(args)
+                mocked_process.assert_not_called()
+
+        with open(output_file, "r") as f:
+            self.assertEqual(f.read(), expected_table, 
+                "main wrote an incorrect cached ranking table")
+
+        reopened_cache = RankingCache(self.cache_dir, 1024)
+        self.assertEqual((reopened_cache.hits, reopened_cache.misses), (1, 1),
+            "main failed to record cache hits and misses")
+
+if __name__ == "__main__":
+    unittest.main()
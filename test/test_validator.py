@@ -0,0 +1,146 @@
+import os
+import gzip
+import tempfile
+import unittest
+from concurrent.futures import Future
+from unittest.mock import patch
+from io import StringIO
+
+import modules.validator as validator
+from modules.compiled_format import compileResultsFile
+import league_ranker as lr
+
+class CountingExecutor:
+    """Runs submitted tasks immediately, and records the most tasks whose 
+    results were pending at once."""
+
+    def __init__(self):
+        self.pending = 0
+        self.max_pending = 0
+
+    def submit(self, fn, *args):
+        executor = self
+        executor.pending += 1
+        executor.max_pending = max(executor.max_pending, executor.pending)
+
+        class CountingFuture(Future):
+            def result(self, timeout=None):
+                executor.pending -= 1
+                return super().result(timeout)
+
+        future = CountingFuture()
+        future.set_result(fn(*args))
+        return future
+
+class TestValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.test_input_file = os.path.join(self.temp_dir.name, "test_data.txt")
+
+        self.lines = []
+        self.expected_errors = []
+        for index in range(1, 201):
+            if index % 7 == 0:
+                self.lines.append(f"Team {index} 1 Team {index + 1} 2")
+                self.expected_errors.append((index, "INVALID ENTRY: Game result must be a comma delimited string of team scores."))
+            elif index % 11 == 0:
+                self.lines.append(f"Team {index} 1a, Team {index + 1} 2")
+                self.expected_errors.append((index, "INVALID ENTRY: Team 1 score is not an integer."))
+            else:
+                self.lines.append(f"Team {index} 1, Team {index + 1} 2")
+
+        with open(self.test_input_file, "w") as f:
+            f.write("\n".join(self.lines) + "\n")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_checkInputFile(self):
+        self.assertEqual(validator.checkInputFile(self.test_input_file), 
+            (len(self.lines), self.expected_errors), 
+            "checkInputFile reported incorrect errors")
+
+    def test_checkInputFile_parallel(self):
+        with patch("modules.validator.ChunkBytes", 100):
+            self.assertGreater(len(list(validator.getFileChunks(self.test_input_file))), 4, 
+                "getFileChunks failed to split the file into more chunks than workers")
+
+            self.assertEqual(validator.checkInputFile(self.test_input_file, 4), 
+                (len(self.lines), self.expected_errors), 
+                "checkInputFile reported incorrect errors using worker processes")
+
+    def test_getFileChunks(self):
+        with patch("modules.validator.ChunkBytes", 100):
+            chunks = list(validator.getFileChunks(self.test_input_file))
+
+        self.assertEqual(chunks[0][0], 0)
+        self.assertEqual(chunks[-1][1], os.path.getsize(self.test_input_file))
+        with open(self.test_input_file, "rb") as f:
+            data = f.read()
+
+        for (_, end), (start, _) in zip(chunks[:-1], chunks[1:]):
+            self.assertEqual(end, start, "getFileChunks left a gap between chunks")
+            self.assertEqual(data[start - 1:start], b"\n", 
+                "getFileChunks split the file in the middle of a line")
+
+        for start, end in chunks[:-1]:
+            self.assertLessEqual(end - start, 100 + len(max(self.lines, key=len)) + 1, 
+                "getFileChunks returned a chunk larger than ChunkBytes and a line")
+
+    def test_checkPlainFile_bounded(self):
+        executor = CountingExecutor()
+        with patch("modules.validator.ChunkBytes", 100):
+            self.assertEqual(validator.checkPlainFile(self.test_input_file, executor, 3), 
+                (len(self.lines), self.expected_errors), 
+                "checkPlainFile reported incorrect errors")
+
+        self.assertEqual(executor.max_pending, 3, 
+            "checkPlainFile submitted more chunks than max_pending")
+
+    def test_checkCompressedFile(self):
+        compressed_file = self.test_input_file + ".gz"
+        with open(self.test_input_file, "rb") as f_in, \
+            gzip.open(compressed_file, "wb") as f_out:
+            f_out.write(f_in.read())
+
+        with patch("modules.validator.MinimumCompressedBytes", 1), \
+            patch("modules.validator.BatchLines", 30):
+            self.assertEqual(validator.checkInputFile(compressed_file, 2), 
+                (len(self.lines), self.expected_errors), 
+                "checkInputFile reported incorrect errors for a compressed file")
+
+    def test_checkCompressedFile_bounded(self):
+        compressed_file = self.test_input_file + ".gz"
+        with open(self.test_input_file, "rb") as f_in, \
+            gzip.open(compressed_file, "wb") as f_out:
+            f_out.write(f_in.read())
+
+        executor = CountingExecutor()
+        with patch("modules.validator.BatchLines", 10):
+            self.assertEqual(validator.checkCompressedFile(compressed_file, executor, 3), 
+                (len(self.lines), self.expected_errors), 
+                "checkCompressedFile reported incorrect errors")
+
+        self.assertEqual(executor.max_pending, 3, 
+            "checkCompressedFile submitted more batches than max_pending")
+
+    def test_checkCompiledFile(self):
+        compiled_file = os.path.join(self.temp_dir.name, "test_data.lrb")
+        compileResultsFile(os.path.join("test", "test_data.txt"), compiled_file)
+
+        with self.assertRaises(Exception):
+            validator.checkInputFile(compiled_file)
+
+    def test_main_check(self):
+        mock_cmdline = StringIO()
+        with patch("sys.stdout", new=mock_cmdline):
+            lr.main(["--check", self.test_input_file])
+
+        mock_cmdline.seek(0)
+        output = mock_cmdline.read()
+        self.assertIn("Line 7: INVALID ENTRY: Game result must be a comma delimited string of team scores.", output)
+        self.assertIn(f"Checked 200 lines in '{self.test_input_file}': {len(self.expected_errors)} invalid.", output)
+
+if __name__ == "__main__":
+    unittest.main()